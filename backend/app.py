@@ -1,15 +1,27 @@
 """FastAPI application exposing the search pipeline."""
 
+from typing import Any
+
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
-from typing import Any, Dict
+from fastapi.responses import JSONResponse, Response
 from .search import run_query_pipeline
 
-app = FastAPI(title="Property Search API")
+
+class ORJSONResponse(Response):
+    """JSON response rendered by orjson (NumPy scalars/arrays serialize natively)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+app = FastAPI(title="Property Search API", default_response_class=ORJSONResponse)
 
 
 @app.post("/api/search")
-async def search_endpoint(request: Request) -> Dict[str, Any]:
+async def search_endpoint(request: Request) -> ORJSONResponse:
     body = await request.json()
     query = body.get("query", "")
     use_gemini = bool(body.get("use_gemini", False))
@@ -17,8 +29,9 @@ async def search_endpoint(request: Request) -> Dict[str, Any]:
 
     try:
         out = run_query_pipeline(query, use_gemini=use_gemini, top_k=top_k)
-        # out already contains serializable filters/summary/cards/results
-        return out
+        # out already contains serializable filters/summary/cards/results, so
+        # hand it straight to orjson instead of FastAPI's jsonable_encoder pass
+        return ORJSONResponse(content=out)
     except Exception as e:
         # Return a JSON error payload instead of HTML to help clients debug
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -1,10 +1,12 @@
 """Load and normalize CSV data; provide cached datasets."""
 
 from __future__ import annotations
+import hashlib
 import os
 import re
-from functools import lru_cache
-from typing import Tuple, Optional, List
+import shutil
+from typing import Any, Dict, Tuple, Optional, List, Sequence
+import numpy as np
 import pandas as pd
 
 
@@ -16,14 +18,39 @@ def _data_dir() -> str:
     return os.path.join(_repo_root(), "data")
 
 
-def _read_csv(fname: str) -> pd.DataFrame:
+def _cache_dir() -> str:
+    return os.path.join(_data_dir(), "_cache")
+
+
+def _read_csv(fname: str, usecols: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Read a CSV from data/, optionally keeping only `usecols`.
+
+    `usecols` names are matched after strip + lowercase so callers can use the
+    normalized column names regardless of the header casing in the file.
+    """
     path = os.path.join(_data_dir(), fname)
+    wanted = None
+    if usecols is not None:
+        keep = set(usecols)
+
+        def wanted(col: str) -> bool:
+            return col.strip().lower() in keep
+
     # read loosely to tolerate minor CSV inconsistencies in the dataset
     try:
-        return pd.read_csv(path, encoding="utf-8", on_bad_lines="skip")
+        return pd.read_csv(path, encoding="utf-8", on_bad_lines="skip", usecols=wanted)
     except TypeError:
         # older pandas versions used error_bad_lines kw; fall back
-        return pd.read_csv(path, encoding="utf-8", engine="python")
+        return pd.read_csv(path, encoding="utf-8", engine="python", usecols=wanted)
+
+
+# price/bhk patterns, compiled once and shared by the scalar and Series parsers
+_NUM_RE = re.compile(r"(\d+\.?\d*)")
+_LAKH_RE = re.compile(r"\b\d+\.?\d*\s*l\b")
+_BHK_RE = re.compile(r"(\d+)")
+# unit-less price cells handed to `pd.to_numeric`; anything else (exponents,
+# stray text) never reaches it, since malformed numerics can crash pandas
+_PLAIN_NUM_RE = re.compile(r"\d+(?:\.\d*)?|\.\d+")
 
 
 def parse_price_to_lakhs(price_str):
@@ -32,13 +59,13 @@ def parse_price_to_lakhs(price_str):
     s = str(price_str).strip().lower().replace("₹", "").replace(",", "")
     # crore
     if "cr" in s or "crore" in s:
-        m = re.findall(r"\d+\.?\d*", s)
+        m = _NUM_RE.findall(s)
         if not m:
             return None
         return float(m[0]) * 100.0
     # lakh
-    if "lakh" in s or re.search(r"\b\d+\.?\d*\s*l\b", s):
-        m = re.findall(r"\d+\.?\d*", s)
+    if "lakh" in s or _LAKH_RE.search(s):
+        m = _NUM_RE.findall(s)
         if not m:
             return None
         return float(m[0])
@@ -61,7 +88,7 @@ def normalize_bhk(bhk_str):
     s = str(bhk_str).strip().lower()
     if "studio" in s:
         return 0
-    m = re.search(r"(\d+)", s)
+    m = _BHK_RE.search(s)
     if m:
         return int(m.group(1))
     try:
@@ -70,8 +97,145 @@ def normalize_bhk(bhk_str):
         return None
 
 
+def parse_price_to_lakhs_series(prices: pd.Series) -> pd.Series:
+    """Vectorized `parse_price_to_lakhs` over a whole column (NaN for unparsable)."""
+    missing = prices.isna().to_numpy()
+    s = (
+        prices.astype(str)
+        .str.strip()
+        .str.lower()
+        .str.replace("₹", "", regex=False)
+        .str.replace(",", "", regex=False)
+    )
+    num = pd.to_numeric(s.str.extract(_NUM_RE, expand=False), errors="coerce")
+    is_cr = s.str.contains("cr", regex=False).to_numpy()
+    is_lakh = (
+        s.str.contains("lakh", regex=False) | s.str.contains(_LAKH_RE)
+    ).to_numpy()
+    # plain numbers: large values are absolute rupees, small ones already lakhs
+    plain = s.where(s.str.fullmatch(_PLAIN_NUM_RE))
+    plain = pd.to_numeric(plain, errors="coerce").to_numpy(dtype=float)
+    plain = np.where(plain > 100000, plain / 100000.0, plain)
+    num = num.to_numpy(dtype=float)
+    out = np.select([is_cr, is_lakh], [num * 100.0, num], default=plain)
+    return pd.Series(np.where(missing, np.nan, out), index=prices.index)
+
+
+def normalize_bhk_series(values: pd.Series) -> pd.Series:
+    """Vectorized `normalize_bhk` over a whole column (NaN when unknown)."""
+    missing = values.isna().to_numpy()
+    s = values.astype(str).str.strip().str.lower()
+    num = pd.to_numeric(s.str.extract(_BHK_RE, expand=False), errors="coerce")
+    num = num.where(~s.str.contains("studio", regex=False), 0.0)
+    return pd.Series(
+        np.where(missing, np.nan, num.to_numpy(dtype=float)), index=values.index
+    )
+
+
 # module level cache for fast repeated loads
 _CACHED_DF: Optional[pd.DataFrame] = None
+# packed per-column arrays of _CACHED_DF, see `column_arrays`
+_COL_CACHE: Optional[Dict[str, Any]] = None
+# bumped whenever _CACHED_DF is (re)built; lets callers key memoized results on it
+_DF_VERSION = 0
+
+# source files hashed into the on-disk Parquet cache key
+_SOURCE_CSVS = (
+    "project.csv",
+    "ProjectAddress.csv",
+    "ProjectConfiguration.csv",
+    "ProjectConfigurationVariant.csv",
+)
+# bump whenever the normalization pipeline changes its output
+_CACHE_VERSION = 5
+
+# fixed possession vocabulary; `possession_norm` is always one of these
+POSSESSION_CATEGORIES = ("ready", "under_construction", "unknown")
+POSSESSION_DTYPE = pd.CategoricalDtype(list(POSSESSION_CATEGORIES), ordered=False)
+# raw status spellings (lowercased, separators collapsed to "_") -> canonical value
+_POSSESSION_ALIASES = {
+    "ready": "ready",
+    "ready_to_move": "ready",
+    "under_construction": "under_construction",
+    "uc": "under_construction",
+}
+
+
+_POSSESSION_SEP_RE = re.compile(r"[\s\-]+")
+
+
+def canonical_possession_value(value: Any) -> str:
+    """Map one raw possession/status value onto a `POSSESSION_CATEGORIES` name.
+
+    Matching is case-insensitive and treats spaces and hyphens like "_", so
+    "Ready to move", "READY_TO_MOVE" and "ready-to-move" all become "ready";
+    anything unrecognized (including missing values) becomes "unknown".
+    """
+    if value is None:
+        return "unknown"
+    key = _POSSESSION_SEP_RE.sub("_", str(value).strip().lower())
+    return _POSSESSION_ALIASES.get(key, "unknown")
+
+
+def canonical_possession(values: pd.Series) -> pd.Series:
+    """Map raw possession/status values onto `POSSESSION_DTYPE`.
+
+    Vectorized `canonical_possession_value`: each distinct value is mapped
+    once and the result is broadcast back through the factorized codes.
+    """
+    codes, uniques = pd.factorize(values)
+    # one extra slot so missing values (code -1) land on "unknown"
+    lookup = np.array(
+        [POSSESSION_CATEGORIES.index(canonical_possession_value(v)) for v in uniques]
+        + [POSSESSION_CATEGORIES.index("unknown")],
+        dtype=np.int8,
+    )
+    cat = pd.Categorical.from_codes(lookup[codes], dtype=POSSESSION_DTYPE)
+    return pd.Series(cat, index=values.index, name=values.name)
+
+
+# columns read from each source CSV (normalized names; missing ones are ignored)
+_PROJECT_COLS = ("id", "status", "possession", "projectname", "project_name", "name")
+_ADDRESS_COLS = (
+    "projectid",
+    "fulladdress",
+    "full_address",
+    "address",
+    "fulladdressline",
+)
+_CONFIG_COLS = (
+    "id",
+    "projectid",
+    "type",
+    "custombhk",
+    "custom_bhk",
+    "bhk",
+)
+_VARIANT_COLS = ("configurationid", "price", "price_lakhs", "amount")
+# string columns whose values feed keys or parsed fields (stripped on load)
+_STRIP_COLS = frozenset(
+    {
+        "id",
+        "projectid",
+        "configurationid",
+        "status",
+        "possession",
+        "projectname",
+        "project_name",
+        "name",
+        "fulladdress",
+        "full_address",
+        "address",
+        "fulladdressline",
+        "custombhk",
+        "custom_bhk",
+        "bhk",
+        "type",
+        "price",
+        "price_lakhs",
+        "amount",
+    }
+)
 
 
 def _first_existing_column(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
@@ -82,36 +246,167 @@ def _first_existing_column(df: pd.DataFrame, candidates: List[str]) -> Optional[
     return None
 
 
+def _source_fingerprint() -> str:
+    """Hash the name, size and mtime of every source CSV (plus the cache version)."""
+    h = hashlib.sha1(f"v{_CACHE_VERSION}".encode())
+    for fname in _SOURCE_CSVS:
+        path = os.path.join(_data_dir(), fname)
+        try:
+            st = os.stat(path)
+            h.update(f"{fname}:{st.st_size}:{st.st_mtime_ns}".encode())
+        except OSError:
+            h.update(f"{fname}:missing".encode())
+    return h.hexdigest()[:16]
+
+
+def _parquet_cache_path(fingerprint: str) -> str:
+    return os.path.join(_cache_dir(), f"projects-{fingerprint}.parquet")
+
+
+def _array_cache_dir(fingerprint: str) -> str:
+    return os.path.join(_cache_dir(), f"arrays-{fingerprint}")
+
+
+def _read_parquet_cache(path: str) -> Optional[pd.DataFrame]:
+    """Return the cached frame, or None when missing/unreadable (e.g. no pyarrow)."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_parquet(path, engine="pyarrow", memory_map=True)
+    except Exception:
+        return None
+
+
+def _write_parquet_cache(df: pd.DataFrame, path: str) -> None:
+    """Best-effort write of the normalized frame; failures only cost a rebuild."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df.to_parquet(tmp, engine="pyarrow", compression="zstd", index=False)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _read_array_cache(path: str) -> Optional[Dict[str, Any]]:
+    """Memory-map the cached column arrays (see `_build_column_arrays`).
+
+    Arrays are opened read-only with `mmap_mode="r"`, so every worker process
+    shares the same page-cache pages instead of holding its own copy.
+    """
+    arrays: Dict[str, Any] = {}
+    try:
+        for name in _ARRAY_NAMES:
+            arrays[name] = np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+        for name in _INDEX_NAMES:
+            values = np.load(os.path.join(path, f"{name}.npy"))
+            arrays[name] = pd.Index(values.tolist(), dtype=object)
+    except (OSError, ValueError):
+        return None
+    return arrays
+
+
+def _write_array_cache(arrays: Dict[str, Any], path: str) -> None:
+    """Best-effort write of the column arrays as plain `.npy` files."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(tmp, exist_ok=True)
+        for name in _ARRAY_NAMES:
+            np.save(os.path.join(tmp, f"{name}.npy"), np.asarray(arrays[name]))
+        for name in _INDEX_NAMES:
+            # fixed-width unicode keeps the file loadable without pickle
+            values = np.asarray([str(v) for v in arrays[name]], dtype=str)
+            np.save(os.path.join(tmp, f"{name}.npy"), values)
+        os.replace(tmp, path)
+    except Exception:
+        # includes losing the rename race to another worker
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _dropna_keys(df: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Drop rows with a null join `key` (no-op when the column is absent)."""
+    if key not in df.columns:
+        return df
+    return df.dropna(subset=[key])
+
+
 def load_data() -> pd.DataFrame:
     """Load, normalize and return projects DataFrame (cached).
 
+    - Returns the in-process cached frame when already loaded
+    - Otherwise reads `data/_cache/projects-<hash>.parquet` when the source
+      CSVs are unchanged, or rebuilds it with `_build_projects_df`
+    - The filter arrays used by `column_arrays` are memory-mapped from
+      `data/_cache/arrays-<hash>/` (written on first load)
+    - The returned frame is shared; callers must not mutate it in place
+    """
+    global _CACHED_DF, _COL_CACHE, _DF_VERSION
+    if _CACHED_DF is not None:
+        return _CACHED_DF
+
+    fingerprint = _source_fingerprint()
+    path = _parquet_cache_path(fingerprint)
+    df = _read_parquet_cache(path)
+    if df is None:
+        df = _build_projects_df()
+        _write_parquet_cache(df, path)
+    array_path = _array_cache_dir(fingerprint)
+    arrays = _read_array_cache(array_path)
+    if arrays is None:
+        arrays = _build_column_arrays(df)
+        _write_array_cache(arrays, array_path)
+    _CACHED_DF = df
+    _COL_CACHE = arrays
+    _DF_VERSION += 1
+    return _CACHED_DF
+
+
+def dataset_version() -> int:
+    """Return a counter that changes every time the cached frame is rebuilt."""
+    return _DF_VERSION
+
+
+def is_cached_frame(df: pd.DataFrame) -> bool:
+    """Return True when `df` is the frame currently cached by `load_data`."""
+    return df is not None and df is _CACHED_DF
+
+
+def _build_projects_df() -> pd.DataFrame:
+    """Run the full CSV -> normalized `projects_df` pipeline (uncached).
+
     - Reads CSVs from data/ using `_read_csv`
     - Normalizes column names to lowercase and stripped
     - Parses prices into `price_lakhs`
     - Normalizes BHK into `bhk`
     - Extracts `city_norm` and `locality_norm` from address fields
-    - Returns a cached DataFrame (a copy is returned to callers)
     """
-    global _CACHED_DF
-    if _CACHED_DF is not None:
-        return _CACHED_DF.copy()
-
-    project_df = _read_csv("project.csv")
-    address_df = _read_csv("ProjectAddress.csv")
-    config_df = _read_csv("ProjectConfiguration.csv")
-    variant_df = _read_csv("ProjectConfigurationVariant.csv")
+    project_df = _read_csv("project.csv", usecols=_PROJECT_COLS)
+    address_df = _read_csv("ProjectAddress.csv", usecols=_ADDRESS_COLS)
+    config_df = _read_csv("ProjectConfiguration.csv", usecols=_CONFIG_COLS)
+    variant_df = _read_csv("ProjectConfigurationVariant.csv", usecols=_VARIANT_COLS)
 
     # normalize column names: strip + lowercase
     for df in [project_df, address_df, config_df, variant_df]:
         df.columns = df.columns.str.strip().str.lower()
-        # clean string columns
-        for col in df.select_dtypes(["object"]):
-            df[col] = df[col].astype(str).str.strip()
+
+    # rows without a join key can never match; drop them before merging
+    project_df = _dropna_keys(project_df, "id")
+    address_df = _dropna_keys(address_df, "projectid")
+    config_df = _dropna_keys(config_df, "projectid")
+    variant_df = _dropna_keys(variant_df, "configurationid")
+
+    for df in [project_df, address_df, config_df, variant_df]:
+        # clean only the string columns used downstream; object columns read
+        # from CSV already hold str (or NaN), so no astype(str) pass is needed
+        for col in _STRIP_COLS.intersection(df.columns):
+            if df[col].dtype == object:
+                df[col] = df[col].str.strip()
 
     # harmonize price column name in variant_df
     price_col = _first_existing_column(variant_df, ["price", "price_lakhs", "amount"])
     if price_col is not None:
-        variant_df["price_lakhs"] = variant_df[price_col].apply(parse_price_to_lakhs)
+        variant_df["price_lakhs"] = parse_price_to_lakhs_series(variant_df[price_col])
     else:
         variant_df["price_lakhs"] = None
 
@@ -120,102 +415,16 @@ def load_data() -> pd.DataFrame:
         config_df, ["custombhk", "custom_bhk", "bhk", "type"]
     )
     if bhk_source is not None:
-        config_df["bhk_norm"] = config_df[bhk_source].apply(normalize_bhk)
+        config_df["bhk_norm"] = normalize_bhk_series(config_df[bhk_source])
     else:
         config_df["bhk_norm"] = None
 
     # possession/status
     status_col = _first_existing_column(project_df, ["status", "possession"])
     if status_col is not None:
-        project_df["possession_norm"] = (
-            project_df[status_col]
-            .astype(str)
-            .str.lower()
-            .replace(
-                {
-                    "ready to move": "ready",
-                    "ready_to_move": "ready",
-                    "ready-to-move": "ready",
-                    "under construction": "under construction",
-                    "uc": "under construction",
-                }
-            )
-        )
+        project_df["possession_norm"] = canonical_possession(project_df[status_col])
     else:
-        project_df["possession_norm"] = None
-
-    # Merge step-by-step using lowered column names
-    merged = project_df.copy()
-
-    # address: find full address field
-    address_full_col = (
-        _first_existing_column(
-            address_df, ["fulladdress", "full_address", "address", "fulladdressline"]
-        )
-        or "fulladdress"
-    )
-    address_cols = [
-        c
-        for c in ["projectid", "landmark", address_full_col, "pincode"]
-        if c in address_df.columns
-    ]
-    if address_cols:
-        merged = pd.merge(
-            merged,
-            address_df[address_cols],
-            left_on="id",
-            right_on="projectid",
-            how="left",
-        )
-
-    # config merge
-    config_cols = [
-        c
-        for c in [
-            "id",
-            "projectid",
-            "propertycategory",
-            "type",
-            "custombhk",
-            "bhk_norm",
-        ]
-        if c in config_df.columns
-    ]
-    config_renamed = (
-        config_df[config_cols].rename(
-            columns={"id": "configid", "projectid": "projectid_config"}
-        )
-        if config_cols
-        else config_df
-    )
-    if "projectid_config" in config_renamed.columns:
-        merged = pd.merge(
-            merged,
-            config_renamed,
-            left_on="id",
-            right_on="projectid_config",
-            how="left",
-        )
-
-    # variant merge
-    variant_cols = [
-        c
-        for c in ["id", "configurationid", "bathrooms", "price_lakhs"]
-        if c in variant_df.columns
-    ]
-    variant_renamed = (
-        variant_df[variant_cols].rename(columns={"id": "variantid"})
-        if variant_cols
-        else variant_df
-    )
-    if "configurationid" in variant_renamed.columns and "configid" in merged.columns:
-        merged = pd.merge(
-            merged,
-            variant_renamed,
-            left_on="configid",
-            right_on="configurationid",
-            how="left",
-        )
+        project_df["possession_norm"] = "unknown"
 
     # extract city/locality from full address
     def extract_city_locality(full_address):
@@ -230,9 +439,56 @@ def load_data() -> pd.DataFrame:
             return None, parts[-1].lower()
         return None, None
 
-    merged["city_norm"], merged["locality_norm"] = zip(
-        *merged[address_full_col].apply(extract_city_locality)
+    # Each side is reduced to the output columns and deduplicated on them
+    # *before* joining, so the joined frame is already duplicate-free rather
+    # than deduplicated at its largest. Join on indexes: each key is set once.
+    merged = project_df.set_index("id")
+
+    # address join: one row per distinct (project, city, locality)
+    address_full_col = (
+        _first_existing_column(
+            address_df, ["fulladdress", "full_address", "address", "fulladdressline"]
+        )
+        or "fulladdress"
     )
+    if {"projectid", address_full_col} <= set(address_df.columns):
+        parts = address_df[address_full_col].map(extract_city_locality)
+        address_df = address_df.assign(
+            city_norm=parts.str[0], locality_norm=parts.str[1]
+        )
+        address_cols = ["city_norm", "locality_norm"]
+        merged = merged.join(
+            address_df.drop_duplicates(["projectid"] + address_cols).set_index(
+                "projectid"
+            )[address_cols],
+            how="left",
+            validate="one_to_many",
+        )
+
+    # config/variant join: prices are attached to configs first, so only
+    # distinct (project, bhk, price) rows ever reach the project frame
+    config_cols = ["bhk_norm"]
+    if "id" in config_df.columns and "configurationid" in variant_df.columns:
+        if not config_df["id"].dropna().is_unique:
+            raise pd.errors.MergeError(
+                "configuration ids are not unique; variant join is not one-to-many"
+            )
+        prices = variant_df.drop_duplicates(["configurationid", "price_lakhs"])
+        config_df = (
+            config_df.set_index("id")[["projectid", "bhk_norm"]]
+            .join(prices.set_index("configurationid")[["price_lakhs"]], how="left")
+            .reset_index(drop=True)
+        )
+        config_cols.append("price_lakhs")
+    if "projectid" in config_df.columns:
+        merged = merged.join(
+            config_df.drop_duplicates(["projectid"] + config_cols).set_index(
+                "projectid"
+            )[config_cols],
+            how="left",
+            validate="one_to_many",
+        )
+    merged = merged.rename_axis("id").reset_index()
 
     # select and canonicalize columns
     keep: List[str] = []
@@ -254,7 +510,7 @@ def load_data() -> pd.DataFrame:
         if c in merged.columns:
             keep.append(c)
 
-    df = merged[keep].drop_duplicates()
+    df = merged[keep]
 
     # rename to canonical names
     rename_map = {}
@@ -283,161 +539,86 @@ def load_data() -> pd.DataFrame:
         if c not in df.columns:
             df[c] = None
 
-    # cache and return a copy to callers to avoid accidental mutation
-    _CACHED_DF = df[final_cols].copy()
-    return _CACHED_DF.copy()
-
-
-@lru_cache(maxsize=1)
-def load_merged_projects() -> pd.DataFrame:
-    """Load and normalize the CSVs and return a single `projects_df` like in the notebook.
-
-    Returns: DataFrame with columns: project_id, project_name, city_norm, locality_norm, bhk, price_lakhs, possession_norm
-    """
-    project_df = _read_csv("project.csv")
-    address_df = _read_csv("ProjectAddress.csv")
-    config_df = _read_csv("ProjectConfiguration.csv")
-    variant_df = _read_csv("ProjectConfigurationVariant.csv")
+    df = df[final_cols].reset_index(drop=True)
+    # compact dtypes: low-cardinality strings as categoricals, bhk as small ints
+    df["city_norm"] = df["city_norm"].astype("category")
+    # rows without a matching project (left join) have no status either
+    df["possession_norm"] = (
+        df["possession_norm"].fillna("unknown").astype(POSSESSION_DTYPE)
+    )
+    bhk = pd.to_numeric(df["bhk"], errors="coerce")
+    # customBHK can hold arbitrary numbers (e.g. "Shop 250"): widen past int8
+    # instead of failing the whole load
+    df["bhk"] = bhk.astype(f"Int{_bhk_int_dtype(bhk).itemsize * 8}")
+    return df
 
-    # basic cleanup
-    for df in [project_df, address_df, config_df, variant_df]:
-        df.columns = df.columns.str.strip()
-        for col in df.select_dtypes(["object"]):
-            df[col] = df[col].astype(str).str.strip()
 
-    # normalize price
-    variant_df["price_lakhs"] = variant_df["price"].apply(parse_price_to_lakhs)
+def _bhk_int_dtype(bhk: pd.Series) -> np.dtype:
+    """Return the smallest signed int dtype holding every `bhk` value and -1."""
+    known = bhk.dropna()
+    lo = min(known.min(), -1) if len(known) else -1
+    hi = known.max() if len(known) else -1
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
 
-    # normalize bhk
-    if "customBHK" in config_df.columns:
-        config_df["bhk_norm"] = config_df["customBHK"].apply(normalize_bhk)
-    else:
-        config_df["bhk_norm"] = config_df["type"].apply(normalize_bhk)
-
-    # possession
-    if "status" in project_df.columns:
-        project_df["possession_norm"] = (
-            project_df["status"]
-            .astype(str)
-            .str.lower()
-            .replace(
-                {
-                    "ready to move": "ready",
-                    "ready_to_move": "ready",
-                    "ready-to-move": "ready",
-                    "under construction": "under construction",
-                    "uc": "under construction",
-                }
-            )
-        )
-    else:
-        project_df["possession_norm"] = None
-
-    # Merge step-by-step
-    merged = project_df.copy()
-    address_cols = ["projectId", "landmark", "fullAddress", "pincode"]
-    address_keep = [c for c in address_cols if c in address_df.columns]
-    merged = pd.merge(
-        merged, address_df[address_keep], left_on="id", right_on="projectId", how="left"
-    )
 
-    config_cols = [
-        c
-        for c in [
-            "id",
-            "projectId",
-            "propertyCategory",
-            "type",
-            "customBHK",
-            "bhk_norm",
-        ]
-        if c in config_df.columns
-    ]
-    config_renamed = config_df[config_cols].rename(
-        columns={"id": "configId", "projectId": "projectId_config"}
-    )
-    merged = pd.merge(
-        merged, config_renamed, left_on="id", right_on="projectId_config", how="left"
-    )
+# keys of `_build_column_arrays`: NumPy arrays and pandas Index categories
+_ARRAY_NAMES = ("city_codes", "possession_codes", "bhk", "price_lakhs")
+_INDEX_NAMES = ("city_categories",)
 
-    variant_cols = [
-        c
-        for c in ["id", "configurationId", "bathrooms", "price_lakhs"]
-        if c in variant_df.columns
-    ]
-    variant_renamed = variant_df[variant_cols].rename(columns={"id": "variantId"})
-    merged = pd.merge(
-        merged,
-        variant_renamed,
-        left_on="configId",
-        right_on="configurationId",
-        how="left",
-    )
-
-    # extract city/locality from fullAddress
-    def extract_city_locality(full_address):
-        if pd.isna(full_address):
-            return None, None
-        parts = [p.strip() for p in str(full_address).split(",") if p.strip()]
-        if len(parts) >= 2:
-            locality = parts[-2].lower()
-            city = parts[-1].lower()
-            return city, locality
-        if len(parts) == 1:
-            return None, parts[-1].lower()
-        return None, None
 
-    merged["city_norm"], merged["locality_norm"] = zip(
-        *merged["fullAddress"].apply(extract_city_locality)
-    )
+def _build_column_arrays(df: pd.DataFrame) -> Dict[str, Any]:
+    """Extract the filter columns of `df` as packed NumPy arrays.
 
-    # select columns
-    keep = []
-    # use existing key names if present
-    if "id" in merged.columns:
-        keep.append("id")
-    if "projectName" in merged.columns:
-        keep.append("projectName")
-    for c in [
-        "city_norm",
-        "locality_norm",
-        "bhk_norm",
-        "price_lakhs",
-        "possession_norm",
-    ]:
-        if c in merged.columns:
-            keep.append(c)
+    Categorical columns are stored as their integer codes (-1 for missing) next
+    to their categories, `bhk` as the smallest int dtype that fits (int8 for the
+    usual 0-10 range; -1 for missing) and `price_lakhs` as
+    float32 (NaN for missing).
+    """
+    city = df["city_norm"]
+    if not isinstance(city.dtype, pd.CategoricalDtype):
+        city = city.astype("category")
+    poss = df["possession_norm"]
+    if poss.dtype != POSSESSION_DTYPE:
+        poss = canonical_possession(poss)
+    bhk = pd.to_numeric(df["bhk"], errors="coerce").round()
+    return {
+        "city_codes": city.cat.codes.to_numpy(),
+        "city_categories": city.cat.categories,
+        "possession_codes": poss.cat.codes.to_numpy(),
+        "bhk": bhk.fillna(-1).to_numpy(dtype=_bhk_int_dtype(bhk)),
+        "price_lakhs": pd.to_numeric(df["price_lakhs"], errors="coerce").to_numpy(
+            dtype=np.float32
+        ),
+    }
+
+
+def column_arrays(df: pd.DataFrame) -> Dict[str, Any]:
+    """Return packed column arrays for `df` (see `_build_column_arrays`).
+
+    Arrays for the cached `load_data` frame are computed once and reused across
+    queries; any other frame gets freshly built arrays.
+    """
+    global _COL_CACHE
+    if df is _CACHED_DF and _COL_CACHE is not None:
+        return _COL_CACHE
+    arrays = _build_column_arrays(df)
+    if df is _CACHED_DF:
+        _COL_CACHE = arrays
+    return arrays
 
-    df = merged[keep].drop_duplicates()
-    # rename to canonical
-    rename_map = {}
-    if "id" in df.columns:
-        rename_map["id"] = "project_id"
-    if "projectName" in df.columns:
-        rename_map["projectName"] = "project_name"
-    if "bhk_norm" in df.columns:
-        rename_map["bhk_norm"] = "bhk"
-    df = df.rename(columns=rename_map)
 
-    # ensure bhk is numeric
-    if "bhk" in df.columns:
-        df["bhk"] = pd.to_numeric(df["bhk"], errors="coerce")
+def load_merged_projects() -> pd.DataFrame:
+    """Load and normalize the CSVs and return a single `projects_df` like in the notebook.
 
-    # keep final columns expected by the rest of the package
-    final_cols = [
-        "project_id",
-        "project_name",
-        "city_norm",
-        "locality_norm",
-        "bhk",
-        "price_lakhs",
-        "possession_norm",
-    ]
-    for c in final_cols:
-        if c not in df.columns:
-            df[c] = None
+    Thin alias of `load_data` kept for backward compatibility.
 
-    return df[final_cols]
+    Returns: DataFrame with columns: project_id, project_name, city_norm, locality_norm, bhk, price_lakhs, possession_norm
+    """
+    return load_data()
 
 
 def load_projects_df() -> pd.DataFrame:
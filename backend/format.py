@@ -1,17 +1,33 @@
 """Formatting helpers for results -> card dictionaries."""
 
 import re
+from functools import lru_cache
 
-# quote_plus was used previously for CTA generation; slug generator now keeps slugs safe
+import numpy as np
 import pandas as pd
 
+_SLUG_RE = re.compile(r"[^a-z0-9\-]")
 
+
+# card text is drawn from a small, repetitive vocabulary (cities, localities,
+# project names), so the per-card string work is memoized
+@lru_cache(maxsize=4096)
 def slugify(s: str) -> str:
-    return re.sub(r"[^a-z0-9\-]", "-", s.lower()).strip("-")
+    return _SLUG_RE.sub("-", s.lower()).strip("-")
+
+
+@lru_cache(maxsize=4096)
+def _title_case(s: str) -> str:
+    return s.title()
+
+
+def is_missing(val) -> bool:
+    """Scalar NA check: None, pd.NA, or NaN (the only value unequal to itself)."""
+    return val is None or val is pd.NA or val != val
 
 
 def price_format_from_lakhs(val):
-    if pd.isna(val) or val is None:
+    if is_missing(val):
         return "N/A"
     v = float(val)
     if v >= 100:
@@ -19,48 +35,65 @@ def price_format_from_lakhs(val):
     return f"₹{v:.2f} L"
 
 
+def _price_slug(val):
+    try:
+        if is_missing(val):
+            return "price-na"
+        v = float(val)
+    except Exception:
+        return "price-na"
+    if v >= 100:
+        cr = v / 100.0
+        # replace decimal point with hyphen to keep slug safe
+        return f"{cr:.2f}".replace(".", "-") + "-cr"
+    # lakhs: prefer integer representation when possible
+    if abs(v - round(v)) < 1e-6:
+        return f"{int(round(v))}-l"
+    return f"{v:.2f}".replace(".", "-") + "-l"
+
+
 def make_project_card(row: dict) -> dict:
-    # row can be a Series or mapping
-    bk = row.get("bhk") if isinstance(row, dict) else row["bhk"]
-    locality = (
-        row.get("locality_norm") if isinstance(row, dict) else row["locality_norm"]
-    )
-    city = row.get("city_norm") if isinstance(row, dict) else row["city_norm"]
-    project_name = (
-        row.get("project_name") if isinstance(row, dict) else row["project_name"]
-    )
-    price_l = row.get("price_lakhs") if isinstance(row, dict) else row["price_lakhs"]
-    possession = (
-        row.get("possession_norm") if isinstance(row, dict) else row["possession_norm"]
+    # row can be a Series or mapping; pick the field accessor once
+    if isinstance(row, dict):
+        return _card_from_dict(row)
+    return _card_from_series(row)
+
+
+def _card_from_dict(row: dict) -> dict:
+    return _build_card(
+        row.get("bhk"),
+        row.get("locality_norm"),
+        row.get("city_norm"),
+        row.get("project_name"),
+        row.get("price_lakhs"),
+        row.get("possession_norm"),
+        row.get("relevance_score", 0.0),
     )
 
-    title = f"{int(bk) if bk is not None and not pd.isna(bk) else ''}BHK in {locality.title() if locality else (city.title() if city else '')}".strip()
-    city_locality = (
-        f"{city.title() if city else ''}, {locality.title() if locality else ''}".strip(
-            ", "
-        )
+
+def _card_from_series(row: pd.Series) -> dict:
+    return _build_card(
+        row["bhk"],
+        row["locality_norm"],
+        row["city_norm"],
+        row["project_name"],
+        row["price_lakhs"],
+        row["possession_norm"],
+        row.get("relevance_score", 0.0),
     )
+
+
+def _build_card(bk, locality, city, project_name, price_l, possession, relevance):
+    bhk = None if is_missing(bk) else int(bk)
+    loc_title = _title_case(locality) if locality else ""
+    city_title = _title_case(city) if city else ""
+    title = f"{bhk if bhk is not None else ''}BHK in {loc_title or city_title}".strip()
+    city_locality = f"{city_title}, {loc_title}".strip(", ")
     price = price_format_from_lakhs(price_l)
-    pname = project_name.title() if project_name else ""
-    possession = possession.title() if possession else "Unknown"
+    pname = _title_case(project_name) if project_name else ""
+    possession = _title_case(possession) if possession else "Unknown"
 
     # deterministic slug format: {project}-{locality}--{price-part}
-    def _price_slug(val):
-        try:
-            if pd.isna(val) or val is None:
-                return "price-na"
-            v = float(val)
-        except Exception:
-            return "price-na"
-        if v >= 100:
-            cr = v / 100.0
-            # replace decimal point with hyphen to keep slug safe
-            return f"{cr:.2f}".replace(".", "-") + "-cr"
-        # lakhs: prefer integer representation when possible
-        if abs(v - round(v)) < 1e-6:
-            return f"{int(round(v))}-l"
-        return f"{v:.2f}".replace(".", "-") + "-l"
-
     proj_slug = slugify(pname) if pname else "unknown"
     loc_slug = slugify(locality) if locality else ""
     price_part = _price_slug(price_l)
@@ -69,18 +102,113 @@ def make_project_card(row: dict) -> dict:
     card = {
         "title": title,
         "city_locality": city_locality,
-        "bhk": int(bk) if bk is not None and not pd.isna(bk) else None,
+        "bhk": bhk,
         "price": price,
         "project_name": pname,
         "possession": possession,
         "amenities": [],
         "cta": cta,
-        "relevance_score": float(row.get("relevance_score", 0.0))
-        if hasattr(row, "get")
-        else float(row["relevance_score"]),
+        "relevance_score": float(relevance),
     }
     return card
 
 
+def _text_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """Return `col` as strings, with missing values (or a missing column) as ''."""
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    s = df[col].astype(object)
+    return s.where(s.notna(), "").astype(str)
+
+
+def _slugify_series(s: pd.Series) -> pd.Series:
+    return s.str.lower().str.replace(_SLUG_RE, "-", regex=True).str.strip("-")
+
+
+def _format_series(values: np.ndarray, fmt: str) -> pd.Series:
+    return pd.Series(values).map(fmt.format)
+
+
+def cards_from_df(df: pd.DataFrame) -> list:
+    """Vectorized `make_project_card` over every row of `df`.
+
+    Builds each card field as a whole column with pandas string ops, then
+    converts to a list of dicts once. Output matches `make_project_card`.
+    """
+    if df.empty:
+        return []
+    n = len(df)
+    bhk = pd.to_numeric(df["bhk"], errors="coerce").to_numpy(dtype=float)
+    has_bhk = ~np.isnan(bhk)
+    bhk_int = np.where(has_bhk, bhk, 0).astype(np.int64)
+    bhk_str = pd.Series(np.where(has_bhk, bhk_int.astype(str), ""), dtype=object)
+
+    locality = _text_column(df, "locality_norm").reset_index(drop=True)
+    city = _text_column(df, "city_norm").reset_index(drop=True)
+    loc_title = locality.str.title()
+    city_title = city.str.title()
+    title = (
+        bhk_str + "BHK in " + loc_title.mask(loc_title == "", city_title)
+    ).str.strip()
+    city_locality = (city_title + ", " + loc_title).str.strip(", ")
+
+    prices = pd.to_numeric(df["price_lakhs"], errors="coerce").to_numpy(dtype=float)
+    no_price = np.isnan(prices)
+    is_cr = prices >= 100
+    price = np.where(
+        no_price,
+        "N/A",
+        np.where(
+            is_cr,
+            _format_series(prices / 100, "₹{:.2f} Cr"),
+            _format_series(prices, "₹{:.2f} L"),
+        ),
+    )
+
+    pname = _text_column(df, "project_name").reset_index(drop=True).str.title()
+    possession = _text_column(df, "possession_norm").reset_index(drop=True).str.title()
+    possession = possession.mask(possession == "", "Unknown")
+
+    # deterministic slug format: {project}-{locality}--{price-part}
+    rounded = np.round(prices) + 0.0
+    price_part = np.select(
+        [no_price, is_cr, np.abs(prices - rounded) < 1e-6],
+        [
+            "price-na",
+            _format_series(prices / 100, "{:.2f}").str.replace(".", "-", regex=False)
+            + "-cr",
+            _format_series(rounded, "{:.0f}") + "-l",
+        ],
+        default=_format_series(prices, "{:.2f}").str.replace(".", "-", regex=False)
+        + "-l",
+    )
+    proj_slug = _slugify_series(pname).mask(pname == "", "unknown")
+    loc_slug = _slugify_series(locality)
+    slug = (proj_slug + "-" + loc_slug + "--" + price_part).str.strip("-")
+
+    if "relevance_score" in df.columns:
+        relevance = df["relevance_score"].to_numpy(dtype=float)
+    else:
+        relevance = np.zeros(n, dtype=float)
+
+    cards = pd.DataFrame(
+        {
+            "title": title,
+            "city_locality": city_locality,
+            "bhk": pd.Series(
+                [int(v) if ok else None for v, ok in zip(bhk_int, has_bhk)],
+                dtype=object,
+            ),
+            "price": price,
+            "project_name": pname,
+            "possession": possession,
+            "amenities": [[] for _ in range(n)],
+            "cta": "/project/" + slug,
+            "relevance_score": relevance,
+        }
+    )
+    return cards.to_dict(orient="records")
+
+
 def results_to_cards(df):
-    return [make_project_card(row) for _, row in df.iterrows()]
+    return cards_from_df(df)
@@ -1,49 +1,171 @@
 """Text parsing utilities (rule-based, optional Gemini wrapper)."""
 
 import re
-from typing import Dict, Any, Optional
-from .data_loader import load_projects_df
+from functools import lru_cache
+from typing import Dict, Any, Match, Optional, Pattern, Tuple
+import pandas as pd
+from .data_loader import dataset_version, is_cached_frame, load_projects_df
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process  # type: ignore
+except Exception:
+    # rapidfuzz is optional; project names then fall back to substring matching
+    _rf_fuzz = None
+    _rf_process = None
 
 
 BUDGET_RE = re.compile(
-    r"under\s+₹?\s*?([\d\.,]+)\s*(cr|crore|lakh|lakh?s|l|k)?|below\s+₹?\s*?([\d\.,]+)\s*(cr|crore|lakh|lakh?s|l|k)?|up to\s+₹?\s*?([\d\.,]+)\s*(cr|crore|lakh|lakh?s|l|k)?",
+    r"(?:under|below|up to)\s+₹?\s*?(?P<num>[\d\.,]+)\s*(?P<unit>cr|crore|lakh|lakh?s|l|k)?",
+    re.IGNORECASE,
+)
+
+# every keyword hint the rule-based parser looks for; see `_scan_hints`
+_HINT_PATTERNS = {
+    "budget": f"(?:{BUDGET_RE.pattern})",
+    "bhk": r"(?P<bhk_n>\d+)\s*bhk",
+    "ready": r"ready to move|ready-to-move|\bread\b",
+    "uc": r"under construction|\buc\b",
+    "metro": r"near metro|\bmetro\b",
+    "it": r"near it|it park|\bit\b",
+}
+# one zero-width alternation: `finditer` tries every position once, and the
+# lookahead lets hints overlap (e.g. "under 3 bhk" is both a budget and a bhk)
+_HINT_RE = re.compile(
+    "(?=" + "|".join(f"(?P<{k}>{v})" for k, v in _HINT_PATTERNS.items()) + ")",
     re.IGNORECASE,
 )
 
 
+def _scan_hints(q: str) -> Dict[str, Match[str]]:
+    """Return the leftmost `_HINT_RE` match of each hint found in `q`."""
+    first: Dict[str, Match[str]] = {}
+    for m in _HINT_RE.finditer(q):
+        first.setdefault(m.lastgroup, m)
+        if len(first) == len(_HINT_PATTERNS):
+            break
+    return first
+
+
 def parse_budget_to_lakhs_from_match(m):
     if not m:
         return None
-    # find first numeric group
-    groups = [g for g in m.groups() if g]
-    if not groups:
-        return None
-    # extract numeric and unit
-    num = None
-    unit = None
-    for i in range(0, len(m.groups()), 2):
-        if m.groups()[i]:
-            num = m.groups()[i]
-            unit = m.groups()[i + 1] if i + 1 < len(m.groups()) else None
-            break
-    if not num:
+    try:
+        val = float(m.group("num").replace(",", ""))
+    except ValueError:
+        # separators only, e.g. "under ..."
         return None
-    s = str(num).replace(",", "")
-    val = float(s)
-    if unit:
-        unit = unit.lower()
-        if "cr" in unit or "crore" in unit:
-            return val * 100.0
-        if unit.startswith("l"):
-            return val
-        if unit == "k":
-            return val / 100.0
+    unit = (m.group("unit") or "").lower()
+    if unit.startswith("cr"):
+        return val * 100.0
+    if unit.startswith("l"):
+        return val
+    if unit == "k":
+        return val / 100.0
+    # bare numbers: large values are absolute rupees, small ones already lakhs
     if val > 1e5:
         return val / 100000.0
     return val
 
 
+@lru_cache(maxsize=32)
+def _vocab_pattern(values: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Compile a vocabulary into one word-bounded alternation (longest first).
+
+    The alternation sits inside a lookahead so `finditer` reports a candidate at
+    every position, including matches that overlap a shorter earlier one.
+    """
+    vocab = sorted(
+        {str(v).strip().lower() for v in values} - {""}, key=len, reverse=True
+    )
+    if not vocab:
+        return None
+    alternation = "|".join(re.escape(v) for v in vocab)
+    return re.compile(r"(?=\b(" + alternation + r")\b)")
+
+
+def _column_vocab(projects_df: pd.DataFrame, column: str) -> Tuple[str, ...]:
+    """Return the distinct non-null values of `column` (cached for the loader's frame)."""
+    if is_cached_frame(projects_df):
+        return _cached_column_vocab(column, dataset_version())
+    return tuple(projects_df[column].dropna().unique())
+
+
+@lru_cache(maxsize=8)
+def _cached_column_vocab(column: str, df_version: int) -> Tuple[str, ...]:
+    """Distinct values of `column` in the cached dataset, built once per version."""
+    return tuple(load_projects_df()[column].dropna().unique())
+
+
+def _longest_vocab_match(values: Tuple[str, ...], q: str) -> Optional[str]:
+    """Return the longest vocabulary value in `values` appearing as a word in `q`."""
+    pattern = _vocab_pattern(values)
+    if pattern is None:
+        return None
+    return max((m.group(1) for m in pattern.finditer(q)), key=len, default=None)
+
+
+# (names, lowercased names, (lower, name) pairs longest first)
+_NameIndex = Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[Tuple[str, str], ...]]
+
+
+def _build_project_name_index(projects_df: pd.DataFrame) -> _NameIndex:
+    """Return the unique project names, their lowercase forms (same order) and
+    `(lower, name)` pairs sorted longest first."""
+    # dedupe raw values first (unique keeps first-seen order), then strip the
+    # much smaller set and dedupe again for names differing only in whitespace
+    raw = projects_df["project_name"].dropna().unique()
+    names = tuple(dict.fromkeys(str(p).strip() for p in raw))
+    lowered = tuple(n.lower() for n in names)
+    by_length = sorted(
+        ((low, n) for low, n in zip(lowered, names) if n),
+        key=lambda x: len(x[0]),
+        reverse=True,
+    )
+    return names, lowered, tuple(by_length)
+
+
+@lru_cache(maxsize=1)
+def _cached_project_name_index(df_version: int) -> _NameIndex:
+    """`_build_project_name_index` of the cached dataset, built once per version."""
+    return _build_project_name_index(load_projects_df())
+
+
+def _project_name_index(projects_df: pd.DataFrame) -> _NameIndex:
+    if is_cached_frame(projects_df):
+        return _cached_project_name_index(dataset_version())
+    return _build_project_name_index(projects_df)
+
+
 def rule_based_parse(query: str, projects_df=None) -> Dict[str, Any]:
+    """Extract structured filters from a free-text query.
+
+    Results for the loader's cached dataset are memoized on the lowercased query
+    (parsing is case-insensitive), so repeated queries skip the work entirely.
+    """
+    if projects_df is None:
+        projects_df = load_projects_df()
+    if is_cached_frame(projects_df):
+        items = _rule_based_parse_cached(query.lower(), dataset_version())
+        filters = dict(items)
+        filters["soft"] = list(filters["soft"])
+        return filters
+    return _rule_based_parse(query, projects_df)
+
+
+@lru_cache(maxsize=4096)
+def _rule_based_parse_cached(
+    q_norm: str, df_version: int
+) -> Tuple[Tuple[str, Any], ...]:
+    """Hashable, memoized form of `_rule_based_parse` over the cached dataset.
+
+    `df_version` is part of the key so a rebuilt dataset invalidates entries.
+    """
+    filters = _rule_based_parse(q_norm, load_projects_df())
+    filters["soft"] = tuple(filters["soft"])
+    return tuple(filters.items())
+
+
+def _rule_based_parse(query: str, projects_df: pd.DataFrame) -> Dict[str, Any]:
     q = query.lower()
     filters = {
         "city": None,
@@ -55,73 +177,50 @@ def rule_based_parse(query: str, projects_df=None) -> Dict[str, Any]:
         "soft": [],
     }
 
+    # all keyword hints in a single pass over the query
+    hints = _scan_hints(q)
+
     # bhk
-    m = re.search(r"(\d+)\s*bhk", query, flags=re.IGNORECASE)
-    if m:
-        filters["bhk"] = int(m.group(1))
+    if "bhk" in hints:
+        filters["bhk"] = int(hints["bhk"].group("bhk_n"))
 
-    m = BUDGET_RE.search(query)
-    if m:
+    if "budget" in hints:
+        m = BUDGET_RE.match(q, hints["budget"].start())
         filters["budget_lakhs_max"] = parse_budget_to_lakhs_from_match(m)
 
     # possession canonicalization
-    if "ready to move" in q or "ready-to-move" in q or re.search(r"\bread\b", q):
+    if "ready" in hints:
         # canonical: "Ready"
         filters["possession"] = "Ready"
-    if "under construction" in q or re.search(r"\buc\b", q):
+    if "uc" in hints:
         # canonical: "Under_Construction"
         filters["possession"] = "Under_Construction"
 
-    if projects_df is None:
-        projects_df = load_projects_df()
-
     # city/locality extraction (ensure lowercased + trimmed)
-    cities = [
-        str(c).strip().lower()
-        for c in projects_df["city_norm"].dropna().unique().tolist()
-    ]
-    cities = sorted(set(cities), key=len, reverse=True)
-    for city in cities:
-        if city and re.search(r"\b" + re.escape(city) + r"\b", q):
-            filters["city"] = city
-            break
-
-    localities = [
-        str(loc).strip().lower()
-        for loc in projects_df["locality_norm"].dropna().unique().tolist()
-    ]
-    localities = sorted(set(localities), key=len, reverse=True)
-    for loc in localities:
-        if loc and re.search(r"\b" + re.escape(loc) + r"\b", q):
-            filters["locality"] = loc
-            break
-
-    proj_names = [
-        str(p).strip() for p in projects_df["project_name"].dropna().unique().tolist()
-    ]
-    if proj_names:
-        # Try fuzzy matching if available; otherwise deterministic substring match
-        matched = None
-        try:
-            from rapidfuzz import fuzz, process  # type: ignore
-
-            best = process.extractOne(q, proj_names, scorer=fuzz.partial_ratio)
-            if best and best[1] >= 80:
-                matched = best[0]
-        except Exception:
-            # deterministic fallback: longest project name that appears as substring
-            proj_lower = [(p.lower(), p) for p in proj_names]
-            proj_lower.sort(key=lambda x: len(x[0]), reverse=True)
-            for low, orig in proj_lower:
-                if low and low in q:
-                    matched = orig
-                    break
-        if matched:
-            filters["project_name"] = matched
-
-    if "near metro" in q or " near metro" in q or re.search(r"\bmetro\b", q):
+    filters["city"] = _longest_vocab_match(_column_vocab(projects_df, "city_norm"), q)
+    filters["locality"] = _longest_vocab_match(
+        _column_vocab(projects_df, "locality_norm"), q
+    )
+
+    names, names_lower, names_by_length = _project_name_index(projects_df)
+    matched = None
+    if names and _rf_process is not None:
+        # q is lowercase, so compare against the pre-lowered names (no
+        # processor) and map the hit back to its original casing by position
+        best = _rf_process.extractOne(
+            q, names_lower, scorer=_rf_fuzz.partial_ratio, score_cutoff=80
+        )
+        if best:
+            matched = names[best[2]]
+    elif names:
+        # deterministic fallback: longest project name that appears as substring
+        matched = next((orig for low, orig in names_by_length if low in q), None)
+    if matched:
+        filters["project_name"] = matched
+
+    if "metro" in hints:
         filters["soft"].append("near metro")
-    if "near it" in q or "it park" in q or re.search(r"\bit\b", q):
+    if "it" in hints:
         filters["soft"].append("near it park")
 
     return filters
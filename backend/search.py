@@ -1,42 +1,185 @@
 """Search and ranking logic for projects."""
 
-from typing import Dict, Any, List
+import copy
+from functools import lru_cache
+from typing import Dict, Any, List, Sequence
+import numpy as np
 import pandas as pd
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process  # type: ignore
+except Exception:
+    # rapidfuzz is optional; fall back to the difflib-based scorer below
+    _rf_fuzz = None
+    _rf_process = None
+
 # higher-level pipeline imports (kept local to this module so callers can use a
 # single function that wires parsing, search, summary and formatting together)
 from .parsing import rule_based_parse, gemini_extract_filters
-from .data_loader import load_projects_df
+from .data_loader import (
+    POSSESSION_CATEGORIES,
+    canonical_possession_value,
+    column_arrays,
+    dataset_version,
+    load_projects_df,
+)
 from .summary import generate_summary_from_df
 from .format import results_to_cards
 
+# possession filter value -> category code in `possession_norm`
+_POSSESSION_CODES = {
+    name: code for code, name in enumerate(POSSESSION_CATEGORIES) if name != "unknown"
+}
 
-def _partial_ratio(a: str, b: str) -> float:
-    """Return a 0-100 partial-ratio score between two strings.
 
-    Prefer rapidfuzz if installed; otherwise use a deterministic difflib-based
-    best-window ratio scaled to 0-100.
+def _to_bytes(s: str) -> np.ndarray:
+    """Return the lowercased UTF-8 bytes of `s` as a uint8 array."""
+    return np.frombuffer(str(s).lower().encode("utf-8"), dtype=np.uint8)
+
+
+@lru_cache(maxsize=None)
+def _numba_kernels():
+    """Return the `(partial_ratio_nb, partial_ratio_batch_nb)` Numba kernels.
+
+    Only the no-rapidfuzz fallback needs them, so numba is imported (and the
+    kernels compiled) on first use instead of at module import. Returns None
+    when numba is not installed; callers then stay on difflib.
     """
     try:
-        from rapidfuzz import fuzz as _rf_fuzz  # type: ignore
-
-        return float(_rf_fuzz.partial_ratio(a, b))
+        from numba import njit, prange  # type: ignore
     except Exception:
-        if not a or not b:
-            return 0.0
-        a = str(a).lower()
-        b = str(b).lower()
-        if len(a) > len(b):
+        return None
+
+    @njit(cache=True)
+    def partial_ratio_nb(a, b):
+        """Best sliding-window LCS ratio (0-100) of byte arrays `a` and `b`.
+
+        Approximates the difflib fallback: for every window of the longer input
+        with the length of the shorter one, compute the longest common
+        subsequence and keep the best `lcs / len(shorter)` ratio.
+        """
+        if a.shape[0] > b.shape[0]:
             a, b = b, a
-        best = 0.0
-        la = len(a)
-        for i in range(0, len(b) - la + 1):
-            window = b[i : i + la]
-            r = SequenceMatcher(None, a, window).ratio()
-            if r > best:
-                best = r
-        return best * 100.0
+        la = a.shape[0]
+        lb = b.shape[0]
+        if la == 0:
+            return 0.0
+        prev = np.zeros(la + 1, dtype=np.int32)
+        cur = np.zeros(la + 1, dtype=np.int32)
+        best = 0
+        for start in range(lb - la + 1):
+            prev[:] = 0
+            for i in range(la):
+                c = b[start + i]
+                cur[0] = 0
+                for j in range(la):
+                    if c == a[j]:
+                        cur[j + 1] = prev[j] + 1
+                    elif prev[j + 1] >= cur[j]:
+                        cur[j + 1] = prev[j + 1]
+                    else:
+                        cur[j + 1] = cur[j]
+                prev, cur = cur, prev
+            if prev[la] > best:
+                best = prev[la]
+                if best == la:
+                    break
+        return best * 100.0 / la
+
+    @njit(parallel=True, cache=True)
+    def partial_ratio_batch_nb(q, flat, offsets):
+        """Score `q` against every string packed in `flat` (CSR layout).
+
+        String `i` is `flat[offsets[i]:offsets[i + 1]]`; empty strings score 0.
+        Rows are spread across threads with `prange`.
+        """
+        n = offsets.shape[0] - 1
+        out = np.zeros(n, dtype=np.float64)
+        for i in prange(n):
+            lo = offsets[i]
+            hi = offsets[i + 1]
+            if hi > lo:
+                out[i] = partial_ratio_nb(q, flat[lo:hi])
+        return out
+
+    return partial_ratio_nb, partial_ratio_batch_nb
+
+
+def _partial_ratio(a: str, b: str) -> float:
+    """Return a 0-100 partial-ratio score between two strings.
+
+    Prefer rapidfuzz if installed; then a Numba-compiled sliding-window ratio;
+    otherwise use a deterministic difflib-based best-window ratio scaled to 0-100.
+    """
+    if _rf_fuzz is not None:
+        return float(_rf_fuzz.partial_ratio(a, b))
+    if not a or not b:
+        return 0.0
+    kernels = _numba_kernels()
+    if kernels is not None:
+        return float(kernels[0](_to_bytes(a), _to_bytes(b)))
+    a = str(a).lower()
+    b = str(b).lower()
+    if len(a) > len(b):
+        a, b = b, a
+    best = 0.0
+    la = len(a)
+    for i in range(0, len(b) - la + 1):
+        window = b[i : i + la]
+        r = SequenceMatcher(None, a, window).ratio()
+        if r > best:
+            best = r
+    return best * 100.0
+
+
+def _partial_ratio_scores(query: str, choices: Sequence[str]) -> np.ndarray:
+    """Return a float array of 0-100 partial-ratio scores of `query` vs `choices`.
+
+    Uses a single batched `rapidfuzz.process.cdist` call when available so the
+    whole column is scored in C instead of one Python call per row.
+    """
+    if not choices:
+        return np.zeros(0, dtype=float)
+    if _rf_process is not None:
+        return _rf_process.cdist(
+            [query],
+            choices,
+            scorer=_rf_fuzz.partial_ratio,
+            dtype=np.float64,
+            workers=-1,
+        )[0]
+    kernels = _numba_kernels()
+    if kernels is not None:
+        # pack the whole column into one byte buffer + offsets and score all
+        # rows in a single multi-threaded kernel call
+        qb = _to_bytes(query)
+        if not qb.shape[0]:
+            return np.zeros(len(choices), dtype=float)
+        encoded = [_to_bytes(c) for c in choices]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([e.shape[0] for e in encoded], out=offsets[1:])
+        flat = np.concatenate(encoded) if offsets[-1] else np.zeros(0, np.uint8)
+        return kernels[1](qb, flat, offsets)
+    return np.fromiter(
+        (_partial_ratio(query, c) for c in choices), dtype=float, count=len(choices)
+    )
+
+
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the `top_k` highest scores, best first, ties in index order.
+
+    Same result as `np.argsort(-scores, kind="stable")[:top_k]`, but only the
+    rows scoring at least the k-th best value are sorted; `np.partition` finds
+    that threshold in linear time.
+    """
+    n = scores.shape[0]
+    if top_k <= 0 or top_k >= n:
+        return np.argsort(-scores, kind="stable")[:top_k]
+    threshold = np.partition(scores, n - top_k)[n - top_k]
+    candidates = np.flatnonzero(scores >= threshold)
+    order = np.argsort(-scores[candidates], kind="stable")[:top_k]
+    return candidates[order]
 
 
 def search_projects(
@@ -44,95 +187,124 @@ def search_projects(
 ) -> List[Dict[str, Any]]:
     """Filter and rank projects, returning a list of serializable dict records.
 
+    Thin wrapper around `search_projects_df` for callers that want records.
+    """
+    return _records_from_df(search_projects_df(filters, projects_df, top_k=top_k))
+
+
+def search_projects_df(
+    filters: Dict, projects_df: pd.DataFrame, top_k: int = 10
+) -> pd.DataFrame:
+    """Filter and rank projects, returning the top_k rows as a DataFrame.
+
     - Applies exact filters for city, bhk and possession (case-insensitive)
     - Filters by budget (price_lakhs <= budget_lakhs_max)
     - Computes a numeric `relevance_score` used to sort results
-    - Returns top_k records as list[dict]
+    - Returns the top_k rows (with `relevance_score`) sorted by score
     """
-    df = projects_df.copy()
-    # strict filters
+    cols = column_arrays(projects_df)
+    # strict filters: AND predicates on packed column arrays, then select once
+    mask = np.ones(len(projects_df), dtype=bool)
     if filters.get("city"):
-        df = df[df["city_norm"].str.lower() == str(filters["city"]).strip().lower()]
+        city = str(filters["city"]).strip().lower()
+        code = cols["city_categories"].get_indexer([city])[0]
+        if code < 0:
+            return _empty_results(projects_df)
+        mask &= cols["city_codes"] == code
     if filters.get("bhk") is not None:
-        df = df[df["bhk"] == filters["bhk"]]
+        mask &= (cols["bhk"] == filters["bhk"]) & (cols["bhk"] >= 0)
     if filters.get("budget_lakhs_max") is not None:
-        df = df[df["price_lakhs"].notna()]
-        df = df[df["price_lakhs"] <= filters["budget_lakhs_max"]]
+        prices = cols["price_lakhs"]
+        mask &= ~np.isnan(prices) & (prices <= np.float32(filters["budget_lakhs_max"]))
     if filters.get("possession"):
-        # normalize possession comparison (allow variants like 'Ready' or 'ready' or 'Under_Construction')
-        poss = str(filters["possession"]).lower().replace("_", " ")
-        df = df[
-            df["possession_norm"].astype(str).str.lower().str.contains(poss, na=False)
-        ]
-
-    df = df.reset_index(drop=True)
-    if df.empty:
-        return []
-
-    scores = []
-    for _, row in df.iterrows():
-        score = 0.0
-        qname = filters.get("project_name") or ""
-        if qname and isinstance(qname, str):
-            # fuzzy matching: try to use rapidfuzz if available, otherwise use
-            # a deterministic difflib-based partial ratio fallback.
-            try:
-                # local import avoids hard dependency at module import time
-                from rapidfuzz import fuzz as _rf_fuzz  # type: ignore
-
-                part_score = _rf_fuzz.partial_ratio(
-                    qname, str(row.get("project_name", ""))
-                )
-            except Exception:
-                # Use module-level deterministic fallback when rapidfuzz isn't available
-                part_score = _partial_ratio(qname, str(row.get("project_name", "")))
-
-            score += (part_score / 100.0) * 50
-        loc = filters.get("locality") or ""
-        if loc and row.get("locality_norm"):
-            score += _partial_ratio(loc, str(row.get("locality_norm", ""))) / 100.0 * 30
-        for s in filters.get("soft", []):
-            if (
-                s in str(row.get("project_name", "")).lower()
-                or s in str(row.get("locality_norm", "")).lower()
-            ):
-                score += 10
-        if (
-            filters.get("budget_lakhs_max")
-            and row.get("price_lakhs") not in (None, "")
-            and pd.notna(row.get("price_lakhs"))
-        ):
-            diff = max(0, filters["budget_lakhs_max"] - float(row["price_lakhs"]))
-            score += min(10, (diff / max(1.0, float(filters["budget_lakhs_max"]))) * 10)
-        scores.append(score)
-
-    df["relevance_score"] = scores
-    df = df.sort_values(by="relevance_score", ascending=False).head(top_k)
-
-    # convert to serializable list of dicts
-    records = []
-    raw = df.to_dict(orient="records")
-    for r in raw:
-        nr = {k: _normalize_record_value(v) for k, v in r.items()}
-        records.append(nr)
-    return records
-
-
-def _normalize_record_value(v: Any):
-    """Convert pandas/numpy scalar values to native Python types and map NA -> None."""
-    try:
-        # pandas NA / numpy scalar
-        if pd.isna(v):
-            return None
-    except Exception:
-        pass
-    # numpy scalar to python scalar
-    if hasattr(v, "item"):
-        try:
-            return v.item()
-        except Exception:
-            return v
-    return v
+        # spell the filter the way the stored codes were built ("Under
+        # Construction", "under-construction", "UC", ...); an unrecognized
+        # value matches nothing
+        name = canonical_possession_value(filters["possession"])
+        code = _POSSESSION_CODES.get(name, -1)
+        if code < 0:
+            return _empty_results(projects_df)
+        mask &= cols["possession_codes"] == code
+
+    rows = np.flatnonzero(mask)
+    if rows.size == 0:
+        return _empty_results(projects_df)
+
+    # score only the columns the ranking reads; full rows are materialized for
+    # the top_k winners alone
+    scores = np.zeros(rows.size, dtype=float)
+    names = projects_df["project_name"].iloc[rows].astype(str)
+    localities = projects_df["locality_norm"].iloc[rows]
+
+    qname = filters.get("project_name") or ""
+    if qname and isinstance(qname, str):
+        scores += _partial_ratio_scores(qname, names.tolist()) / 100.0 * 50
+
+    loc = filters.get("locality") or ""
+    if loc:
+        has_loc = (localities.notna() & (localities.astype(str) != "")).to_numpy()
+        if has_loc.any():
+            loc_scores = _partial_ratio_scores(
+                loc, localities[has_loc].astype(str).tolist()
+            )
+            scores[has_loc] += loc_scores / 100.0 * 30
+
+    soft = filters.get("soft", [])
+    if soft:
+        # one lowered haystack per row; the NUL separator keeps a term from
+        # matching across the name/locality boundary
+        haystack = (names + "\0" + localities.astype(str)).str.lower()
+        hits = np.zeros(rows.size, dtype=np.int64)
+        for s in soft:
+            hits += haystack.str.contains(s, regex=False).to_numpy(dtype=bool)
+        scores += hits * 10.0
+
+    budget = filters.get("budget_lakhs_max")
+    if budget:
+        budget = float(budget)
+        prices = pd.to_numeric(projects_df["price_lakhs"], errors="coerce")
+        prices = prices.to_numpy(dtype=float)[rows]
+        bonus = np.clip((budget - prices) / max(1.0, budget) * 10, 0, 10)
+        scores += np.where(np.isnan(prices), 0.0, bonus)
+
+    # highest score first, ties in dataset order
+    top = _top_k_indices(scores, top_k)
+    df = projects_df.iloc[rows[top]].reset_index(drop=True)
+    df["relevance_score"] = scores[top]
+    return df
+
+
+def _empty_results(projects_df: pd.DataFrame) -> pd.DataFrame:
+    """Return a zero-row result frame with the same columns as a real result."""
+    return projects_df.iloc[:0].assign(relevance_score=np.zeros(0, dtype=float))
+
+
+def _records_from_df(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a result frame to a serializable list of dicts.
+
+    One bulk conversion: casting to object unwraps NumPy/pandas scalars to
+    native Python values, and missing values (NaN/NA) become None.
+    """
+    boxed = df.astype(object)
+    return boxed.where(df.notna(), None).to_dict(orient="records")
+
+
+# parsed filter keys that narrow or rank results ("soft" is checked separately)
+_FILTER_KEYS = (
+    "city",
+    "bhk",
+    "budget_lakhs_max",
+    "possession",
+    "locality",
+    "project_name",
+)
+
+
+def _has_any_filter(filters: Dict[str, Any]) -> bool:
+    """Return True when `filters` resolved at least one usable constraint."""
+    return any(filters.get(k) not in (None, "") for k in _FILTER_KEYS) or bool(
+        filters.get("soft")
+    )
 
 
 def run_query_pipeline(
@@ -144,13 +316,36 @@ def run_query_pipeline(
     APIs (which themselves may use cached loaders). The return value contains
     only JSON-serializable Python primitives (lists/dicts/str/int/float/None).
 
+    Rule-based results are memoized per (lowercased query, top_k, dataset
+    version); callers receive a deep copy so mutating it cannot poison the
+    cache. Gemini-backed calls are never cached.
+
+    Queries that resolve no filters at all return no results and the summary
+    "Please refine your query." without running the search.
+
     Returns a dict with keys: filters, summary, cards, results
     - filters: dict of parsed filters
     - summary: human readable string
     - cards: list of card dicts (formatted for UI)
     - results: list of raw result records (dicts) with primitive values
     """
-    # load dataset (uses lru_cache inside loader)
+    if use_gemini:
+        return _run_query_pipeline(query, use_gemini=True, top_k=top_k)
+    # load first so the dataset version reflects the frame actually in use
+    load_projects_df()
+    cached = _run_query_pipeline_cached(query.lower(), top_k, dataset_version())
+    return copy.deepcopy(cached)
+
+
+@lru_cache(maxsize=1024)
+def _run_query_pipeline_cached(
+    q_norm: str, top_k: int, df_version: int
+) -> Dict[str, Any]:
+    return _run_query_pipeline(q_norm, use_gemini=False, top_k=top_k)
+
+
+def _run_query_pipeline(query: str, use_gemini: bool, top_k: int) -> Dict[str, Any]:
+    # load dataset (cached inside the loader)
     projects_df = load_projects_df()
 
     # parse filters
@@ -160,11 +355,18 @@ def run_query_pipeline(
     else:
         filters = rule_based_parse(query, projects_df=projects_df)
 
-    # search (returns a list of dicts)
-    results_records = search_projects(filters, projects_df, top_k=top_k)
+    # nothing to filter or rank on: skip the search entirely
+    if not _has_any_filter(filters):
+        return {
+            "filters": filters,
+            "summary": "Please refine your query.",
+            "cards": [],
+            "results": [],
+        }
 
-    # create a DataFrame view of results for summary/cards generation (empty DF when no results)
-    results_df = pd.DataFrame(results_records)
+    # search (returns the ranked top_k slice; records are derived from it once)
+    results_df = search_projects_df(filters, projects_df, top_k=top_k)
+    results_records = _records_from_df(results_df)
 
     # summary and cards (formatting helper accepts a DataFrame)
     summary = generate_summary_from_df(results_df, filters)
@@ -8,46 +8,126 @@ import streamlit as st
 import os
 import re
 from difflib import SequenceMatcher
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Match, Optional, Pattern, Sequence, Tuple
+import numpy as np
 import pandas as pd
 
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process  # type: ignore
+except Exception:
+    # rapidfuzz is optional; fall back to the difflib-based scorer below
+    _rf_fuzz = None
+    _rf_process = None
+
 # Budget regex and parsing (copied from backend/parsing.py)
 BUDGET_RE = re.compile(
-    r"under\s+₹?\s*?([\d\.,]+)\s*(cr|crore|lakh|lakh?s|l|k)?|below\s+₹?\s*?([\d\.,]+)\s*(cr|crore|lakh|lakh?s|l|k)?|up to\s+₹?\s*?([\d\.,]+)\s*(cr|crore|lakh|lakh?s|l|k)?",
+    r"(?:under|below|up to)\s+₹?\s*?(?P<num>[\d\.,]+)\s*(?P<unit>cr|crore|lakh|lakh?s|l|k)?",
+    re.IGNORECASE,
+)
+
+# every keyword hint the rule-based parser looks for; see `_scan_hints`
+_HINT_PATTERNS = {
+    "budget": f"(?:{BUDGET_RE.pattern})",
+    "bhk": r"(?P<bhk_n>\d+)\s*bhk",
+    "ready": r"ready to move|ready-to-move|\bread\b",
+    "uc": r"under construction|\buc\b",
+    "metro": r"near metro|\bmetro\b",
+    "it": r"near it|it park|\bit\b",
+}
+# one zero-width alternation: `finditer` tries every position once, and the
+# lookahead lets hints overlap (e.g. "under 3 bhk" is both a budget and a bhk)
+_HINT_RE = re.compile(
+    "(?=" + "|".join(f"(?P<{k}>{v})" for k, v in _HINT_PATTERNS.items()) + ")",
     re.IGNORECASE,
 )
 
 
+def _scan_hints(q: str) -> Dict[str, Match[str]]:
+    """Return the leftmost `_HINT_RE` match of each hint found in `q`."""
+    first: Dict[str, Match[str]] = {}
+    for m in _HINT_RE.finditer(q):
+        first.setdefault(m.lastgroup, m)
+        if len(first) == len(_HINT_PATTERNS):
+            break
+    return first
+
+
 def parse_budget_to_lakhs_from_match(m):
     if not m:
         return None
-    groups = [g for g in m.groups() if g]
-    if not groups:
-        return None
-    num = None
-    unit = None
-    for i in range(0, len(m.groups()), 2):
-        if m.groups()[i]:
-            num = m.groups()[i]
-            unit = m.groups()[i + 1] if i + 1 < len(m.groups()) else None
-            break
-    if not num:
+    try:
+        val = float(m.group("num").replace(",", ""))
+    except ValueError:
+        # separators only, e.g. "under ..."
         return None
-    s = str(num).replace(",", "")
-    val = float(s)
-    if unit:
-        unit = unit.lower()
-        if "cr" in unit or "crore" in unit:
-            return val * 100.0
-        if unit.startswith("l"):
-            return val
-        if unit == "k":
-            return val / 100.0
+    unit = (m.group("unit") or "").lower()
+    if unit.startswith("cr"):
+        return val * 100.0
+    if unit.startswith("l"):
+        return val
+    if unit == "k":
+        return val / 100.0
+    # bare numbers: large values are absolute rupees, small ones already lakhs
     if val > 1e5:
         return val / 100000.0
     return val
 
 
+@lru_cache(maxsize=32)
+def _vocab_pattern(values: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Compile a vocabulary into one word-bounded alternation (longest first).
+
+    The alternation sits inside a lookahead so `finditer` reports a candidate at
+    every position, including matches that overlap a shorter earlier one.
+    """
+    vocab = sorted(
+        {str(v).strip().lower() for v in values} - {""}, key=len, reverse=True
+    )
+    if not vocab:
+        return None
+    alternation = "|".join(re.escape(v) for v in vocab)
+    return re.compile(r"(?=\b(" + alternation + r")\b)")
+
+
+def _longest_vocab_match(values: Tuple[str, ...], q: str) -> Optional[str]:
+    """Return the longest vocabulary value in `values` appearing as a word in `q`."""
+    pattern = _vocab_pattern(values)
+    if pattern is None:
+        return None
+    return max((m.group(1) for m in pattern.finditer(q)), key=len, default=None)
+
+
+# parser vocabulary of the last frame seen, see `_frame_vocab`
+_VOCAB_CACHE: Dict[str, Any] = {"frame": None, "vocab": None}
+
+
+def _frame_vocab(projects_df: pd.DataFrame) -> Dict[str, Tuple]:
+    """Return the distinct cities, localities and project names of `projects_df`.
+
+    Cached for the last frame seen: `load_projects_df_local` hands out the same
+    frame on every query, so this runs once per data file version. (It is kept
+    out of `df.attrs`, which pandas deep-copies on every derived frame.)
+    """
+    if _VOCAB_CACHE["frame"] is projects_df:
+        return _VOCAB_CACHE["vocab"]
+    names = tuple(
+        dict.fromkeys(str(p).strip() for p in projects_df["project_name"].dropna())
+    )
+    names_lower = tuple(n.lower() for n in names)
+    vocab = {
+        "city_norm": tuple(projects_df["city_norm"].dropna().unique()),
+        "locality_norm": tuple(projects_df["locality_norm"].dropna().unique()),
+        "names": names,
+        "names_lower": names_lower,
+        "names_by_length": tuple(
+            sorted(zip(names_lower, names), key=lambda x: len(x[0]), reverse=True)
+        ),
+    }
+    _VOCAB_CACHE.update(frame=projects_df, vocab=vocab)
+    return vocab
+
+
 def rule_based_parse(query: str, projects_df=None) -> Dict[str, Any]:
     q = query.lower()
     filters = {
@@ -60,176 +140,305 @@ def rule_based_parse(query: str, projects_df=None) -> Dict[str, Any]:
         "soft": [],
     }
 
+    # all keyword hints in a single pass over the query
+    hints = _scan_hints(q)
+
     # bhk
-    m = re.search(r"(\d+)\s*bhk", query, flags=re.IGNORECASE)
-    if m:
-        filters["bhk"] = int(m.group(1))
+    if "bhk" in hints:
+        filters["bhk"] = int(hints["bhk"].group("bhk_n"))
 
-    m = BUDGET_RE.search(query)
-    if m:
+    if "budget" in hints:
+        m = BUDGET_RE.match(q, hints["budget"].start())
         filters["budget_lakhs_max"] = parse_budget_to_lakhs_from_match(m)
 
     # possession canonicalization
-    if "ready to move" in q or "ready-to-move" in q or re.search(r"\bread\b", q):
+    if "ready" in hints:
         filters["possession"] = "Ready"
-    if "under construction" in q or re.search(r"\buc\b", q):
+    if "uc" in hints:
         filters["possession"] = "Under_Construction"
 
     if projects_df is None:
         projects_df = load_projects_df_local()
 
     # city/locality extraction (ensure lowercased + trimmed)
-    cities = [
-        str(c).strip().lower()
-        for c in projects_df["city_norm"].dropna().unique().tolist()
-    ]
-    cities = sorted(set(cities), key=len, reverse=True)
-    for city in cities:
-        if city and re.search(r"\b" + re.escape(city) + r"\b", q):
-            filters["city"] = city
-            break
+    vocab = _frame_vocab(projects_df)
+    filters["city"] = _longest_vocab_match(vocab["city_norm"], q)
+    filters["locality"] = _longest_vocab_match(vocab["locality_norm"], q)
 
-    localities = [
-        str(loc).strip().lower()
-        for loc in projects_df["locality_norm"].dropna().unique().tolist()
-    ]
-    localities = sorted(set(localities), key=len, reverse=True)
-    for loc in localities:
-        if loc and re.search(r"\b" + re.escape(loc) + r"\b", q):
-            filters["locality"] = loc
-            break
-
-    proj_names = [
-        str(p).strip() for p in projects_df["project_name"].dropna().unique().tolist()
-    ]
+    proj_names = vocab["names"]
     if proj_names:
         matched = None
-        try:
-            from rapidfuzz import fuzz, process  # type: ignore
-
-            best = process.extractOne(q, proj_names, scorer=fuzz.partial_ratio)
-            if best and best[1] >= 80:
-                matched = best[0]
-        except Exception:
-            proj_lower = [(p.lower(), p) for p in proj_names]
-            proj_lower.sort(key=lambda x: len(x[0]), reverse=True)
-            for low, orig in proj_lower:
+        if _rf_process is not None:
+            # q is lowercase: score against lowercased names and map the hit
+            # back to its original casing by position
+            best = _rf_process.extractOne(
+                q, vocab["names_lower"], scorer=_rf_fuzz.partial_ratio, score_cutoff=80
+            )
+            if best:
+                matched = proj_names[best[2]]
+        else:
+            for low, orig in vocab["names_by_length"]:
                 if low and low in q:
                     matched = orig
                     break
         if matched:
             filters["project_name"] = matched
 
-    if "near metro" in q or " near metro" in q or re.search(r"\bmetro\b", q):
+    if "metro" in hints:
         filters["soft"].append("near metro")
-    if "near it" in q or "it park" in q or re.search(r"\bit\b", q):
+    if "it" in hints:
         filters["soft"].append("near it park")
 
     return filters
 
 
-def _partial_ratio(a: str, b: str) -> float:
-    try:
-        from rapidfuzz import fuzz as _rf_fuzz  # type: ignore
+def _to_bytes(s: str) -> np.ndarray:
+    """Return the lowercased UTF-8 bytes of `s` as a uint8 array."""
+    return np.frombuffer(str(s).lower().encode("utf-8"), dtype=np.uint8)
 
-        return float(_rf_fuzz.partial_ratio(a, b))
-    except Exception:
-        if not a or not b:
-            return 0.0
-        a = str(a).lower()
-        b = str(b).lower()
-        if len(a) > len(b):
-            a, b = b, a
-        best = 0.0
-        la = len(a)
-        for i in range(0, len(b) - la + 1):
-            window = b[i : i + la]
-            r = SequenceMatcher(None, a, window).ratio()
-            if r > best:
-                best = r
-        return best * 100.0
 
+@lru_cache(maxsize=None)
+def _numba_kernels():
+    """Return the `(partial_ratio_nb, partial_ratio_batch_nb)` Numba kernels.
 
-def _normalize_record_value(v: Any):
+    Only the no-rapidfuzz fallback needs them, so numba is imported (and the
+    kernels compiled) on first use instead of at module import. Returns None
+    when numba is not installed; callers then stay on difflib.
+    """
     try:
-        if pd.isna(v):
-            return None
+        from numba import njit, prange  # type: ignore
     except Exception:
-        pass
-    if hasattr(v, "item"):
-        try:
-            return v.item()
-        except Exception:
-            return v
-    return v
+        return None
+
+    @njit(cache=True)
+    def partial_ratio_nb(a, b):
+        """Best sliding-window LCS ratio (0-100) of byte arrays `a` and `b`.
+
+        Approximates the difflib fallback: for every window of the longer input
+        with the length of the shorter one, compute the longest common
+        subsequence and keep the best `lcs / len(shorter)` ratio.
+        """
+        if a.shape[0] > b.shape[0]:
+            a, b = b, a
+        la = a.shape[0]
+        lb = b.shape[0]
+        if la == 0:
+            return 0.0
+        prev = np.zeros(la + 1, dtype=np.int32)
+        cur = np.zeros(la + 1, dtype=np.int32)
+        best = 0
+        for start in range(lb - la + 1):
+            prev[:] = 0
+            for i in range(la):
+                c = b[start + i]
+                cur[0] = 0
+                for j in range(la):
+                    if c == a[j]:
+                        cur[j + 1] = prev[j] + 1
+                    elif prev[j + 1] >= cur[j]:
+                        cur[j + 1] = prev[j + 1]
+                    else:
+                        cur[j + 1] = cur[j]
+                prev, cur = cur, prev
+            if prev[la] > best:
+                best = prev[la]
+                if best == la:
+                    break
+        return best * 100.0 / la
+
+    @njit(parallel=True, cache=True)
+    def partial_ratio_batch_nb(q, flat, offsets):
+        """Score `q` against every string packed in `flat` (CSR layout).
+
+        String `i` is `flat[offsets[i]:offsets[i + 1]]`; empty strings score 0.
+        Rows are spread across threads with `prange`.
+        """
+        n = offsets.shape[0] - 1
+        out = np.zeros(n, dtype=np.float64)
+        for i in prange(n):
+            lo = offsets[i]
+            hi = offsets[i + 1]
+            if hi > lo:
+                out[i] = partial_ratio_nb(q, flat[lo:hi])
+        return out
+
+    return partial_ratio_nb, partial_ratio_batch_nb
+
+
+def _partial_ratio(a: str, b: str) -> float:
+    """Return a 0-100 partial-ratio score between two strings.
+
+    Prefer rapidfuzz if installed; then a Numba-compiled sliding-window ratio;
+    otherwise use a deterministic difflib-based best-window ratio scaled to 0-100.
+    """
+    if _rf_fuzz is not None:
+        return float(_rf_fuzz.partial_ratio(a, b))
+    if not a or not b:
+        return 0.0
+    kernels = _numba_kernels()
+    if kernels is not None:
+        return float(kernels[0](_to_bytes(a), _to_bytes(b)))
+    a = str(a).lower()
+    b = str(b).lower()
+    if len(a) > len(b):
+        a, b = b, a
+    best = 0.0
+    la = len(a)
+    for i in range(0, len(b) - la + 1):
+        window = b[i : i + la]
+        r = SequenceMatcher(None, a, window).ratio()
+        if r > best:
+            best = r
+    return best * 100.0
+
+
+def _partial_ratio_scores(query: str, choices: Sequence[str]) -> np.ndarray:
+    """Return a float array of 0-100 partial-ratio scores of `query` vs `choices`.
+
+    Uses a single batched `rapidfuzz.process.cdist` call when available so the
+    whole column is scored in C instead of one Python call per row.
+    """
+    if not choices:
+        return np.zeros(0, dtype=float)
+    if _rf_process is not None:
+        return _rf_process.cdist(
+            [query],
+            choices,
+            scorer=_rf_fuzz.partial_ratio,
+            dtype=np.float64,
+            workers=-1,
+        )[0]
+    kernels = _numba_kernels()
+    if kernels is not None:
+        # pack the whole column into one byte buffer + offsets and score all
+        # rows in a single multi-threaded kernel call
+        qb = _to_bytes(query)
+        if not qb.shape[0]:
+            return np.zeros(len(choices), dtype=float)
+        encoded = [_to_bytes(c) for c in choices]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([e.shape[0] for e in encoded], out=offsets[1:])
+        flat = np.concatenate(encoded) if offsets[-1] else np.zeros(0, np.uint8)
+        return kernels[1](qb, flat, offsets)
+    return np.fromiter(
+        (_partial_ratio(query, c) for c in choices), dtype=float, count=len(choices)
+    )
+
+
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the `top_k` highest scores, best first, ties in index order.
+
+    Same result as `np.argsort(-scores, kind="stable")[:top_k]`, but only the
+    rows scoring at least the k-th best value are sorted; `np.partition` finds
+    that threshold in linear time.
+    """
+    n = scores.shape[0]
+    if top_k <= 0 or top_k >= n:
+        return np.argsort(-scores, kind="stable")[:top_k]
+    threshold = np.partition(scores, n - top_k)[n - top_k]
+    candidates = np.flatnonzero(scores >= threshold)
+    order = np.argsort(-scores[candidates], kind="stable")[:top_k]
+    return candidates[order]
+
+
+def _sorted_category_bounds(values: pd.Series, value: str) -> Tuple[int, int]:
+    """Return the `[lo, hi)` row range holding `value` in a code-sorted categorical."""
+    code = values.cat.categories.get_indexer([value])[0]
+    if code < 0:
+        return 0, 0
+    codes = values.cat.codes.to_numpy()
+    return (
+        int(np.searchsorted(codes, code, side="left")),
+        int(np.searchsorted(codes, code, side="right")),
+    )
 
 
 def search_projects(
     filters: Dict, projects_df: pd.DataFrame, top_k: int = 10
 ) -> List[Dict[str, Any]]:
-    df = projects_df.copy()
-    if filters.get("city"):
-        df = df[df["city_norm"].str.lower() == str(filters["city"]).strip().lower()]
+    # read-only until the final top_k slice, which is a fresh frame; no copy of
+    # the (shared, cached) input is needed
+    df = projects_df
+    # AND every strict filter into one boolean mask, then select rows once
+    city = str(filters["city"]).strip().lower() if filters.get("city") else None
+    if city and df.attrs.get("sorted_by") == "city_norm":
+        # rows are grouped by city code: slice the city's block directly
+        lo, hi = _sorted_category_bounds(df["city_norm"], city)
+        df = df.iloc[lo:hi]
+        city = None
+    mask = np.ones(len(df), dtype=bool)
+    if city:
+        # city_norm is lowercased at load, so this is a categorical code compare
+        mask &= (df["city_norm"] == city).to_numpy()
     if filters.get("bhk") is not None:
-        df = df[df["bhk"] == filters["bhk"]]
+        # na_value: the package loader's fallback frame uses nullable int bhk
+        mask &= (df["bhk"] == filters["bhk"]).to_numpy(dtype=bool, na_value=False)
     if filters.get("budget_lakhs_max") is not None:
-        df = df[df["price_lakhs"].notna()]
-        df = df[df["price_lakhs"] <= filters["budget_lakhs_max"]]
+        prices = df["price_lakhs"]
+        mask &= (prices.notna() & (prices <= filters["budget_lakhs_max"])).to_numpy()
     if filters.get("possession"):
-        poss = str(filters["possession"]).lower().replace("_", " ")
-        df = df[
-            df["possession_norm"].astype(str).str.lower().str.contains(poss, na=False)
-        ]
+        # equality on the canonical spellings ("Under Construction", "UC", ...
+        # all resolve); unrecognized values match nothing
+        key = _POSSESSION_CANONICAL.get(_possession_key(filters["possession"]))
+        valid = _POSSESSION_ALIASES.get(key, ())
+        mask &= df["possession_norm"].isin(valid).to_numpy()
 
-    df = df.reset_index(drop=True)
+    df = df[mask].reset_index(drop=True)
     if df.empty:
         return []
 
-    scores = []
-    for _, row in df.iterrows():
-        score = 0.0
-        qname = filters.get("project_name") or ""
-        if qname and isinstance(qname, str):
-            try:
-                from rapidfuzz import fuzz as _rf_fuzz  # type: ignore
-
-                part_score = _rf_fuzz.partial_ratio(
-                    qname, str(row.get("project_name", ""))
-                )
-            except Exception:
-                part_score = _partial_ratio(qname, str(row.get("project_name", "")))
-            score += (part_score / 100.0) * 50
-        loc = filters.get("locality") or ""
-        if loc and row.get("locality_norm"):
-            score += _partial_ratio(loc, str(row.get("locality_norm", ""))) / 100.0 * 30
-        for s in filters.get("soft", []):
-            if (
-                s in str(row.get("project_name", "")).lower()
-                or s in str(row.get("locality_norm", "")).lower()
-            ):
-                score += 10
-        if (
-            filters.get("budget_lakhs_max")
-            and row.get("price_lakhs") not in (None, "")
-            and pd.notna(row.get("price_lakhs"))
-        ):
-            diff = max(0, filters["budget_lakhs_max"] - float(row["price_lakhs"]))
-            score += min(10, (diff / max(1.0, float(filters["budget_lakhs_max"]))) * 10)
-        scores.append(score)
-
-    df["relevance_score"] = scores
-    df = df.sort_values(by="relevance_score", ascending=False).head(top_k)
-
-    records = []
-    raw = df.to_dict(orient="records")
-    for r in raw:
-        nr = {k: _normalize_record_value(v) for k, v in r.items()}
-        records.append(nr)
-    return records
+    # score whole columns at once instead of one Python round-trip per row
+    scores = np.zeros(len(df), dtype=float)
+    names = df["project_name"].astype(str)
+    localities = df["locality_norm"]
+
+    qname = filters.get("project_name") or ""
+    if qname and isinstance(qname, str):
+        scores += _partial_ratio_scores(qname, names.tolist()) / 100.0 * 50
+
+    loc = filters.get("locality") or ""
+    if loc:
+        has_loc = (localities.notna() & (localities.astype(str) != "")).to_numpy()
+        if has_loc.any():
+            loc_scores = _partial_ratio_scores(
+                loc, localities[has_loc].astype(str).tolist()
+            )
+            scores[has_loc] += loc_scores / 100.0 * 30
+
+    soft = filters.get("soft", [])
+    if soft:
+        # one lowered haystack per row; the NUL separator keeps a term from
+        # matching across the name/locality boundary
+        haystack = (names + "\0" + localities.astype(str)).str.lower()
+        hits = np.zeros(len(df), dtype=np.int64)
+        for s in soft:
+            hits += haystack.str.contains(s, regex=False).to_numpy(dtype=bool)
+        scores += hits * 10.0
+
+    budget = filters.get("budget_lakhs_max")
+    if budget:
+        budget = float(budget)
+        prices = pd.to_numeric(df["price_lakhs"], errors="coerce").to_numpy(dtype=float)
+        bonus = np.clip((budget - prices) / max(1.0, budget) * 10, 0, 10)
+        scores += np.where(np.isnan(prices), 0.0, bonus)
+
+    # highest score first, ties in dataset order
+    top = _top_k_indices(scores, top_k)
+    df = df.iloc[top].reset_index(drop=True)
+    df["relevance_score"] = scores[top]
+
+    # one bulk conversion: object dtype unwraps NumPy scalars to Python values,
+    # and missing values (NaN/NA) become None
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+def _is_missing(val) -> bool:
+    """Scalar NA check: None, pd.NA, or NaN (the only value unequal to itself)."""
+    return val is None or val is pd.NA or val != val
 
 
 def price_format_from_lakhs(val):
-    if pd.isna(val) or val is None:
+    if _is_missing(val):
         return "N/A"
     v = float(val)
     if v >= 100:
@@ -242,23 +451,19 @@ def generate_summary_from_df(df: pd.DataFrame, filters: dict) -> str:
     if n == 0:
         return "No matches found for the requested filters."
 
-    min_p = df["price_lakhs"].dropna()
-    max_p = df["price_lakhs"].dropna()
-    min_p_val = float(min_p.min()) if not min_p.empty else None
-    max_p_val = float(max_p.max()) if not max_p.empty else None
+    prices = df["price_lakhs"].to_numpy(dtype=float, na_value=np.nan)
+    prices = prices[~np.isnan(prices)]
+    min_p_val = float(prices.min()) if prices.size else None
+    max_p_val = float(prices.max()) if prices.size else None
 
-    poss_series = (
-        df["possession_norm"].dropna().astype(str).str.replace(" ", "_").str.title()
-    )
-    ready_count = int((poss_series == "Ready").sum()) if not poss_series.empty else 0
-    uc_count = (
-        int((poss_series == "Under_Construction").sum()) if not poss_series.empty else 0
-    )
+    poss_counts = df["possession_norm"].value_counts()
+    poss_keys = poss_counts.index.astype(str).str.replace(" ", "_").str.title()
+    poss_counts = poss_counts.groupby(poss_keys).sum()
+    ready_count = int(poss_counts.get("Ready", 0))
+    uc_count = int(poss_counts.get("Under_Construction", 0))
 
-    localities = df["locality_norm"].dropna()
-    top_locality = None
-    if not localities.empty:
-        top_locality = localities.value_counts().idxmax()
+    loc_counts = df["locality_norm"].value_counts()
+    top_locality = loc_counts.idxmax() if not loc_counts.empty else None
 
     parts = []
     s1 = f"{n} matching project{'s' if n > 1 else ''} found."
@@ -279,47 +484,58 @@ def generate_summary_from_df(df: pd.DataFrame, filters: dict) -> str:
     return " ".join(parts)
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9\-]")
+
+
+# card text is drawn from a small, repetitive vocabulary (cities, localities,
+# project names), so the per-card string work is memoized
+@lru_cache(maxsize=4096)
 def slugify(s: str) -> str:
-    return re.sub(r"[^a-z0-9\-]", "-", s.lower()).strip("-")
+    return _SLUG_RE.sub("-", s.lower()).strip("-")
+
+
+@lru_cache(maxsize=4096)
+def _title_case(s: str) -> str:
+    return s.title()
+
+
+def _price_slug(val):
+    try:
+        if _is_missing(val):
+            return "price-na"
+        v = float(val)
+    except Exception:
+        return "price-na"
+    if v >= 100:
+        cr = v / 100.0
+        return f"{cr:.2f}".replace(".", "-") + "-cr"
+    if abs(v - round(v)) < 1e-6:
+        return f"{int(round(v))}-l"
+    return f"{v:.2f}".replace(".", "-") + "-l"
 
 
 def make_project_card(row: dict) -> dict:
-    bk = row.get("bhk") if isinstance(row, dict) else row["bhk"]
-    locality = (
-        row.get("locality_norm") if isinstance(row, dict) else row["locality_norm"]
-    )
-    city = row.get("city_norm") if isinstance(row, dict) else row["city_norm"]
-    project_name = (
-        row.get("project_name") if isinstance(row, dict) else row["project_name"]
-    )
-    price_l = row.get("price_lakhs") if isinstance(row, dict) else row["price_lakhs"]
-    possession = (
-        row.get("possession_norm") if isinstance(row, dict) else row["possession_norm"]
+    get = row.get if isinstance(row, dict) else row.__getitem__
+    return _build_card(
+        get("bhk"),
+        get("locality_norm"),
+        get("city_norm"),
+        get("project_name"),
+        get("price_lakhs"),
+        get("possession_norm"),
+        row.get("relevance_score", 0.0),
     )
 
-    title = f"{int(bk) if bk is not None and not pd.isna(bk) else ''}BHK in {locality.title() if locality else (city.title() if city else '')}".strip()
-    city_locality = (
-        f"{city.title() if city else ''}, {locality.title() if locality else ''}".strip(
-            ", "
-        )
-    )
-    price = price_format_from_lakhs(price_l)
-    pname = project_name.title() if project_name else ""
-    possession = possession.title() if possession else "Unknown"
 
-    def _price_slug(val):
-        try:
-            if pd.isna(val) or val is None:
-                return "price-na"
-            v = float(val)
-        except Exception:
-            return "price-na"
-        if v >= 100:
-            cr = v / 100.0
-            return f"{cr:.2f}".replace(".", "-") + "-cr"
-        if abs(v - round(v)) < 1e-6:
-            return f"{int(round(v))}-l"
-        return f"{v:.2f}".replace(".", "-") + "-l"
+def _build_card(bk, locality, city, project_name, price_l, possession, relevance):
+    bhk = None if _is_missing(bk) else int(bk)
+    loc_title = _title_case(locality) if locality else ""
+    city_title = _title_case(city) if city else ""
+    title = f"{bhk if bhk is not None else ''}BHK in {loc_title or city_title}".strip()
+    city_locality = f"{city_title}, {loc_title}".strip(", ")
+    price = price_format_from_lakhs(price_l)
+    pname = _title_case(project_name) if project_name else ""
+    possession = _title_case(possession) if possession else "Unknown"
 
     proj_slug = slugify(pname) if pname else "unknown"
     loc_slug = slugify(locality) if locality else ""
@@ -329,51 +545,155 @@ def make_project_card(row: dict) -> dict:
     card = {
         "title": title,
         "city_locality": city_locality,
-        "bhk": int(bk) if bk is not None and not pd.isna(bk) else None,
+        "bhk": bhk,
         "price": price,
         "project_name": pname,
         "possession": possession,
         "amenities": [],
         "cta": cta,
-        "relevance_score": float(row.get("relevance_score", 0.0))
-        if hasattr(row, "get")
-        else float(row["relevance_score"]),
+        "relevance_score": float(relevance),
     }
     return card
 
 
 def results_to_cards(df: pd.DataFrame):
-    return [make_project_card(row) for _, row in df.iterrows()]
+    if df.empty:
+        return []
+    # pull each column out once and zip, instead of materializing a Series
+    # per row with iterrows
+    cols = df.to_dict(orient="list")
+    missing = [None] * len(df)
+    fields = [
+        cols.get(c, missing)
+        for c in (
+            "bhk",
+            "locality_norm",
+            "city_norm",
+            "project_name",
+            "price_lakhs",
+            "possession_norm",
+        )
+    ]
+    relevance = cols.get("relevance_score", [0.0] * len(df))
+    return [_build_card(*row) for row in zip(*fields, relevance)]
+
+
+_PROJECT_COLS = [
+    "project_id",
+    "project_name",
+    "city_norm",
+    "locality_norm",
+    "bhk",
+    "price_lakhs",
+    "possession_norm",
+]
+# bump whenever `_read_projects_csv` changes the frame it produces
+_LOCAL_CACHE_VERSION = 3
+# parsed possession filter value -> canonical `possession_norm` spellings
+_POSSESSION_ALIASES = {
+    "ready": {"ready", "ready_to_move"},
+    "under_construction": {"under_construction", "uc"},
+}
+# any of those spellings -> its canonical filter key
+_POSSESSION_CANONICAL = {
+    alias: name for name, aliases in _POSSESSION_ALIASES.items() for alias in aliases
+}
+# separators folded to "_" when canonicalizing possession values
+_POSSESSION_SEP_RE = re.compile(r"[\s\-]+")
+
+
+def _possession_key(value: Any) -> str:
+    """Lowercase `value` and fold spaces/hyphens to "_" ("Under Construction")."""
+    return _POSSESSION_SEP_RE.sub("_", str(value).strip().lower())
+
+
+# (csv path, size, mtime) -> loaded frame; one entry per source file version
+_LOCAL_DF_CACHE: Dict[Tuple[str, int, int], pd.DataFrame] = {}
+
+
+def _read_projects_csv(csv_path: str, st_size: int, st_mtime_ns: int) -> pd.DataFrame:
+    """Read `projects_df.csv`, via a Parquet copy in data/_cache when possible.
+
+    The Parquet file is keyed on the CSV's size and mtime, so editing the CSV
+    transparently triggers a fresh conversion.
+    """
+    cache_dir = os.path.join(os.path.dirname(csv_path), "_cache")
+    pq_name = f"projects_df-v{_LOCAL_CACHE_VERSION}-{st_size}-{st_mtime_ns}.parquet"
+    pq_path = os.path.join(cache_dir, pq_name)
+    if os.path.exists(pq_path):
+        try:
+            return pd.read_parquet(pq_path)
+        except Exception:
+            pass
+    df = pd.read_csv(csv_path)
+    # normalize the vocab columns once so per-query lowercasing is a no-op, and
+    # store them as categoricals: filters then compare small integer codes
+    for col in ("city_norm", "locality_norm"):
+        if col in df.columns:
+            if df[col].dtype == object:
+                df[col] = df[col].str.strip().str.lower()
+            df[col] = df[col].astype("category")
+    if "possession_norm" in df.columns:
+        # canonical spelling: lowercase, "_" separators, "unknown" when missing
+        poss = (
+            df["possession_norm"]
+            .astype("string")
+            .str.strip()
+            .str.lower()
+            .str.replace(_POSSESSION_SEP_RE, "_", regex=True)
+        )
+        df["possession_norm"] = poss.fillna("unknown").astype("category")
+    if isinstance(df["city_norm"].dtype, pd.CategoricalDtype):
+        # group rows by city code (missing first, so codes ascend from -1); a
+        # city filter is then a contiguous slice found by binary search
+        df = df.sort_values("city_norm", kind="mergesort", na_position="first")
+        df = df.reset_index(drop=True)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{pq_path}.{os.getpid()}.tmp"
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, pq_path)
+    except Exception:
+        pass
+    return df
 
 
 def load_projects_df_local() -> pd.DataFrame:
     """Load a precomputed `projects_df.csv` from data/ if available, otherwise
     fall back to the package loader in backend.data_loader.
+
+    The loaded frame is cached for the life of the process (until the CSV
+    changes), so chat turns don't re-read the file; callers must not mutate it.
     """
     repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     data_dir = os.path.join(repo_root, "data")
     csv_path = os.path.join(data_dir, "projects_df.csv")
-    if os.path.exists(csv_path):
+    try:
+        st_csv = os.stat(csv_path)
+    except OSError:
+        st_csv = None
+    if st_csv is not None:
+        key = (csv_path, st_csv.st_size, st_csv.st_mtime_ns)
+        cached = _LOCAL_DF_CACHE.get(key)
+        if cached is not None:
+            return cached
         try:
-            return pd.read_csv(csv_path)
+            df = _read_projects_csv(csv_path, st_csv.st_size, st_csv.st_mtime_ns)
         except Exception:
-            pass
-    # fallback: try calling the package loader if present
+            df = None
+        if df is not None:
+            if isinstance(df["city_norm"].dtype, pd.CategoricalDtype):
+                df.attrs["sorted_by"] = "city_norm"
+            _LOCAL_DF_CACHE.clear()
+            _LOCAL_DF_CACHE[key] = df
+            return df
+    # fallback: try calling the package loader if present (cached there)
     try:
         from backend.data_loader import load_projects_df as _pkg_loader  # type: ignore
 
         return _pkg_loader()
     except Exception:
-        cols = [
-            "project_id",
-            "project_name",
-            "city_norm",
-            "locality_norm",
-            "bhk",
-            "price_lakhs",
-            "possession_norm",
-        ]
-        return pd.DataFrame(columns=cols)
+        return pd.DataFrame(columns=_PROJECT_COLS)
 
 
 def run_query_pipeline(
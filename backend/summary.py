@@ -1,10 +1,13 @@
 """Generate short grounded summaries from filtered results."""
 
+import numpy as np
 import pandas as pd
 
+from .format import is_missing
+
 
 def price_format_from_lakhs(val):
-    if pd.isna(val) or val is None:
+    if is_missing(val):
         return "N/A"
     v = float(val)
     if v >= 100:
@@ -18,25 +21,22 @@ def generate_summary_from_df(df: pd.DataFrame, filters: dict) -> str:
         return "No matches found for the requested filters."
 
     # price min/max (from filtered results only)
-    min_p = df["price_lakhs"].dropna()
-    max_p = df["price_lakhs"].dropna()
-    min_p_val = float(min_p.min()) if not min_p.empty else None
-    max_p_val = float(max_p.max()) if not max_p.empty else None
+    prices = df["price_lakhs"].to_numpy(dtype=float, na_value=np.nan)
+    prices = prices[~np.isnan(prices)]
+    min_p_val = float(prices.min()) if prices.size else None
+    max_p_val = float(prices.max()) if prices.size else None
 
-    # possession distribution (canonicalize keys)
-    poss_series = (
-        df["possession_norm"].dropna().astype(str).str.replace(" ", "_").str.title()
-    )
-    ready_count = int((poss_series == "Ready").sum()) if not poss_series.empty else 0
-    uc_count = (
-        int((poss_series == "Under_Construction").sum()) if not poss_series.empty else 0
-    )
+    # possession distribution: count the raw values, then canonicalize only the
+    # handful of distinct keys ("under construction" -> "Under_Construction")
+    poss_counts = df["possession_norm"].value_counts()
+    poss_keys = poss_counts.index.astype(str).str.replace(" ", "_").str.title()
+    poss_counts = poss_counts.groupby(poss_keys).sum()
+    ready_count = int(poss_counts.get("Ready", 0))
+    uc_count = int(poss_counts.get("Under_Construction", 0))
 
     # most common locality (if any)
-    localities = df["locality_norm"].dropna()
-    top_locality = None
-    if not localities.empty:
-        top_locality = localities.value_counts().idxmax()
+    loc_counts = df["locality_norm"].value_counts()
+    top_locality = loc_counts.idxmax() if not loc_counts.empty else None
 
     parts = []
     # sentence 1: total matches (and optional city/bhk/budget context)
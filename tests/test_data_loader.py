@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from backend import data_loader
+from backend.data_loader import (
+    normalize_bhk,
+    normalize_bhk_series,
+    parse_price_to_lakhs,
+    parse_price_to_lakhs_series,
+)
+
+
+def test_price_series_matches_scalar():
+    raw = pd.Series(
+        ["₹1.2 Cr", "75 Lakh", "45 L", "1,20,00,000", "85", "abc", None, "2.5 crore"]
+    )
+    expected = [parse_price_to_lakhs(v) for v in raw]
+    got = parse_price_to_lakhs_series(raw).tolist()
+    for g, e in zip(got, expected):
+        assert (pd.isna(g) and e is None) or g == e
+
+
+def test_price_series_rejects_malformed_numbers():
+    # values like this once reached pd.to_numeric and crashed the process
+    raw = pd.Series(["1e51200000013.", "12abc", "1.2.3", ".5", "85", "1,20,00,000"])
+    got = parse_price_to_lakhs_series(raw).tolist()
+    assert all(pd.isna(v) for v in got[:3])
+    assert got[3:] == [0.5, 85.0, 120.0]
+
+
+def test_bhk_series_matches_scalar():
+    raw = pd.Series(["2BHK", "Studio", "4.5BHK", "1RK ", "Office", None, "3"])
+    expected = [normalize_bhk(v) for v in raw]
+    got = normalize_bhk_series(raw).tolist()
+    for g, e in zip(got, expected):
+        assert (pd.isna(g) and e is None) or g == e
+
+
+def test_array_cache_round_trip(tmp_path):
+    df = pd.DataFrame(
+        {
+            "city_norm": pd.Series(["pune", "mumbai", None], dtype="category"),
+            "bhk": [2, None, 3],
+            "price_lakhs": [45.0, None, 120.5],
+            "possession_norm": ["ready", "UC", None],
+        }
+    )
+    arrays = data_loader._build_column_arrays(df)
+    path = str(tmp_path / "arrays")
+    data_loader._write_array_cache(arrays, path)
+    loaded = data_loader._read_array_cache(path)
+
+    assert loaded is not None
+    assert isinstance(loaded["city_codes"], np.memmap)
+    for name in data_loader._ARRAY_NAMES:
+        np.testing.assert_array_equal(loaded[name], arrays[name])
+    assert loaded["city_categories"].equals(arrays["city_categories"])
+    assert data_loader._read_array_cache(str(tmp_path / "missing")) is None
+
+
+def test_large_custom_bhk_survives_load(tmp_path, monkeypatch):
+    (tmp_path / "project.csv").write_text("id,projectName,status\np1,Alpha,READY\n")
+    (tmp_path / "ProjectAddress.csv").write_text(
+        'projectId,fullAddress\np1,"Baner, Pune"\n'
+    )
+    (tmp_path / "ProjectConfiguration.csv").write_text(
+        "id,projectId,type,customBHK\nc1,p1,2BHK,2BHK\nc2,p1,,Shop 250\nc3,p1,,Unit 300\n"
+    )
+    (tmp_path / "ProjectConfigurationVariant.csv").write_text(
+        "configurationId,price\nc1,45 Lakh\nc2,1.2 Cr\nc3,2 Cr\n"
+    )
+    monkeypatch.setattr(data_loader, "_data_dir", lambda: str(tmp_path))
+
+    df = data_loader._build_projects_df()
+    assert sorted(df["bhk"].tolist()) == [2, 250, 300]
+
+    arrays = data_loader._build_column_arrays(df)
+    assert sorted(arrays["bhk"].tolist()) == [2, 250, 300]
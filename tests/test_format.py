@@ -1,4 +1,11 @@
-from backend.format import price_format_from_lakhs, slugify
+import pandas as pd
+
+from backend.format import (
+    cards_from_df,
+    make_project_card,
+    price_format_from_lakhs,
+    slugify,
+)
 
 
 def test_price_format():
@@ -10,3 +17,20 @@ def test_slugify():
     s = "My Project - Baner, Pune"
     slug = slugify(s)
     assert "my-project" in slug
+
+
+def test_cards_from_df_matches_make_project_card():
+    df = pd.DataFrame(
+        {
+            "project_name": ["Sunshine Residency", None],
+            "city_norm": ["pune", None],
+            "locality_norm": ["baner", "andheri"],
+            "bhk": [3, None],
+            "price_lakhs": [120.0, None],
+            "possession_norm": ["ready", None],
+            "relevance_score": [42.5, 0.0],
+        }
+    )
+    rows = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+    assert cards_from_df(df) == [make_project_card(r) for r in rows]
+    assert cards_from_df(df)[0]["cta"] == "/project/sunshine-residency-baner--1-20-cr"
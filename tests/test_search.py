@@ -0,0 +1,163 @@
+import copy
+import importlib.util
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend import search
+from backend.data_loader import canonical_possession
+from backend.search import run_query_pipeline, search_projects_df
+
+needs_numba = pytest.mark.skipif(
+    importlib.util.find_spec("numba") is None, reason="numba not installed"
+)
+
+
+def _frame():
+    return pd.DataFrame(
+        {
+            "project_name": ["Alpha Heights", "Beta Towers", "Gamma Residency"],
+            "city_norm": pd.Series(["pune", "pune", "mumbai"], dtype="category"),
+            "locality_norm": ["baner", "wakad", "chembur"],
+            "bhk": [2, 3, 2],
+            "price_lakhs": [80.0, 120.0, 60.0],
+            "possession_norm": canonical_possession(
+                pd.Series(["UNDER_CONSTRUCTION", "READY", "UNDER_CONSTRUCTION"])
+            ),
+        }
+    )
+
+
+def test_unparsed_query_short_circuits():
+    out = run_query_pipeline("xyz garbage", top_k=5)
+    assert out["summary"] == "Please refine your query."
+    assert out["cards"] == []
+    assert out["results"] == []
+    assert all(v is None for k, v in out["filters"].items() if k != "soft")
+
+
+def test_parsed_query_runs_search():
+    out = run_query_pipeline("1BHK in Mumbai", top_k=5)
+    assert out["filters"]["bhk"] == 1
+    assert out["summary"] != "Please refine your query."
+    assert len(out["cards"]) == len(out["results"])
+
+
+def test_possession_filter_accepts_spelling_variants():
+    df = _frame()
+    for value in ("Under Construction", "under-construction", "UC"):
+        out = search_projects_df({"possession": value}, df, top_k=5)
+        assert out["project_name"].tolist() == ["Alpha Heights", "Gamma Residency"]
+    assert search_projects_df({"possession": "sold out"}, df).empty
+
+
+@needs_numba
+def test_numba_partial_ratio_matches_difflib(monkeypatch):
+    kernel = search._numba_kernels()[0]
+    # force `_partial_ratio` onto its difflib branch for the reference scores
+    monkeypatch.setattr(search, "_rf_fuzz", None)
+    monkeypatch.setattr(search, "_numba_kernels", lambda: None)
+    pairs = [
+        ("", "alpha"),
+        ("alpha", ""),
+        ("", ""),
+        ("heights", "Alpha Heights Pune"),  # exact substring
+        ("alpha heights pune", "heights"),  # query longer than the name
+        ("baner", "banner"),
+        ("chembur east", "chmbur"),
+        ("xyz", "alpha"),
+    ]
+    for a, b in pairs:
+        got = kernel(search._to_bytes(a), search._to_bytes(b))
+        assert got == pytest.approx(search._partial_ratio(a, b)), (a, b)
+
+
+@needs_numba
+def test_numba_batch_scores_match_row_by_row(monkeypatch):
+    monkeypatch.setattr(search, "_rf_process", None)
+    names = ["Alpha Heights", "", "Beta", "Gamma Residency Phase II", "al", "alphA"]
+    query = "alpha"
+    got = search._partial_ratio_scores(query, names)
+    qb = search._to_bytes(query)
+    kernel = search._numba_kernels()[0]
+    expected = [kernel(qb, search._to_bytes(n)) if n else 0.0 for n in names]
+    assert got.tolist() == pytest.approx(expected)
+    # pinned values: an off-by-one in the offsets would shift them across rows
+    assert got.tolist() == pytest.approx([100.0, 0.0, 25.0, 60.0, 100.0, 100.0])
+    assert search._partial_ratio_scores("", names).tolist() == [0.0] * len(names)
+
+
+def _ranked(filters, top_k=10):
+    out = search_projects_df(filters, _frame(), top_k=top_k)
+    return out["project_name"].tolist(), out["relevance_score"].tolist()
+
+
+def test_search_scores_and_ordering():
+    pr = search._partial_ratio
+
+    # city is a strict filter; an exact locality hit is worth 30
+    names, scores = _ranked({"city": "Pune", "locality": "baner"})
+    assert names == ["Alpha Heights", "Beta Towers"]
+    assert scores == pytest.approx([30.0, pr("baner", "wakad") * 0.3])
+
+    # an exact project-name hit is worth 50
+    names, scores = _ranked({"project_name": "Gamma"})
+    assert names[0] == "Gamma Residency"
+    expected = {n: pr("Gamma", n) * 0.5 for n in _frame()["project_name"]}
+    assert scores == pytest.approx([expected[n] for n in names])
+    assert scores == sorted(scores, reverse=True)
+
+    # each soft term found in the name or locality adds 10; ties keep row order
+    names, scores = _ranked({"soft": ["heights", "chembur"]})
+    assert names == ["Alpha Heights", "Gamma Residency", "Beta Towers"]
+    assert scores == [10.0, 10.0, 0.0]
+
+    # under budget: cheaper rows earn a larger bonus
+    names, scores = _ranked({"budget_lakhs_max": 100})
+    assert names == ["Gamma Residency", "Alpha Heights"]
+    assert scores == pytest.approx([4.0, 2.0])
+
+
+def test_search_without_matches_returns_empty_frame():
+    for filters in ({"city": "delhi"}, {"bhk": 5}, {"budget_lakhs_max": 10}):
+        out = search_projects_df(filters, _frame())
+        assert out.empty
+        assert "relevance_score" in out.columns
+
+
+def test_top_k_matches_stable_sort():
+    rng = np.random.default_rng(0)
+    # few distinct values so the k-th score is almost always tied
+    scores = rng.integers(0, 4, size=50).astype(float)
+    full = np.argsort(-scores, kind="stable")
+    for k in (0, 1, 7, 49, 50, 80):
+        np.testing.assert_array_equal(search._top_k_indices(scores, k), full[:k])
+
+
+def test_search_top_k_smaller_equal_and_larger_than_matches():
+    # soft scores [10, 0, 10]: ties resolve in dataset order
+    filters = {"soft": ["heights", "chembur"]}
+    for top_k, expected in (
+        (1, ["Alpha Heights"]),
+        (2, ["Alpha Heights", "Gamma Residency"]),
+        (3, ["Alpha Heights", "Gamma Residency", "Beta Towers"]),
+        (10, ["Alpha Heights", "Gamma Residency", "Beta Towers"]),
+    ):
+        names, _ = _ranked(filters, top_k=top_k)
+        assert names == expected
+
+
+def test_memoized_results_are_isolated_from_callers():
+    query = "2BHK in Pune"
+    first = run_query_pipeline(query, top_k=5)
+    expected = copy.deepcopy(first)
+    assert first["cards"]
+
+    # mutate everything a caller could reach
+    first["cards"].pop()
+    first["results"].clear()
+    first["filters"]["city"] = "nowhere"
+    first["filters"]["soft"].append("poisoned")
+
+    assert run_query_pipeline(query, top_k=5) == expected
@@ -0,0 +1,29 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("streamlit")
+
+from backend import streamlit_app  # noqa: E402
+
+
+def _frame():
+    return pd.DataFrame(
+        {
+            "project_name": ["Alpha Heights", "Beta Towers", "Gamma Residency"],
+            "city_norm": pd.Series(["pune", "pune", "mumbai"], dtype="category"),
+            "locality_norm": ["baner", "wakad", "chembur"],
+            "bhk": [2, 3, 2],
+            "price_lakhs": [80.0, 120.0, 60.0],
+            "possession_norm": ["under_construction", "ready", "uc"],
+        }
+    )
+
+
+def test_possession_filter_accepts_spelling_variants():
+    df = _frame()
+    for value in ("Under_Construction", "Under Construction", "under-construction"):
+        out = streamlit_app.search_projects({"possession": value}, df, top_k=5)
+        assert [r["project_name"] for r in out] == ["Alpha Heights", "Gamma Residency"]
+    out = streamlit_app.search_projects({"possession": "Ready to move"}, df)
+    assert [r["project_name"] for r in out] == ["Beta Towers"]
+    assert streamlit_app.search_projects({"possession": "sold out"}, df) == []